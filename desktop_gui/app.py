@@ -16,17 +16,22 @@ Enterprise-grade design (2026)
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import functools
 import os
+import queue
 import sys
 import logging
+import logging.handlers
 from pathlib import Path
 from typing import Optional
 
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QFont, QIcon
-from PyQt6.QtCore import Qt, QCoreApplication
+from PyQt6.QtCore import QCoreApplication
 
-import qasync
+from desktop_gui.core.event_loop import create_qt_event_loop
 
 # =============================================================================
 # CONSTANTS & PATHS
@@ -37,36 +42,86 @@ APP_ORG = "NOSIS AI"
 APP_DOMAIN = "nosis.ai"
 APP_VERSION = "0.1.0-dev"
 
-ROOT_DIR = Path(__file__).resolve().parents[1]
+# No resolve(): __file__ is already absolute for imported modules,
+# and realpath() walks every parent with a syscall.
+ROOT_DIR = Path(__file__).parent.parent
 ASSETS_DIR = ROOT_DIR / "desktop_gui" / "assets"
 LOG_DIR = ROOT_DIR / "logs" / "desktop_gui"
 
-LOG_DIR.mkdir(parents=True, exist_ok=True)
+ICON_PATH_STR = str(ASSETS_DIR / "icons" / "nosis.ico")
+
+# Set to "1" to disable app.log (also implied when running under pytest)
+NO_FILE_LOG_ENV = "NOSIS_NO_FILE_LOG"
+
+DEFAULT_FONT_FAMILY = "Inter"
+DEFAULT_FONT_SIZE = 10
 
 # =============================================================================
 # LOGGING CONFIGURATION
 # =============================================================================
 
-_logger: Optional[logging.Logger] = None
+# Time-of-day only: cheaper strftime than the default date+ms stamp
+LOG_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+    datefmt="%H:%M:%S",
+)
+
+
+def _file_logging_enabled() -> bool:
+    return os.environ.get(NO_FILE_LOG_ENV) != "1" and "pytest" not in sys.modules
 
 
+@functools.cache
 def get_logger() -> logging.Logger:
-    global _logger
-    if _logger is None:
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-            handlers=[
-                logging.FileHandler(LOG_DIR / "app.log", encoding="utf-8"),
-                logging.StreamHandler(sys.stdout),
-            ],
-        )
-        _logger = logging.getLogger("nosis.app")
-    return _logger
+    """
+    Configure root logging once and return the app logger.
+
+    Records are handed to a QueueHandler; a QueueListener thread does
+    the actual file / stdout writes, so logging never blocks the
+    Qt / asyncio loop on I/O.
+
+    Under pytest / NOSIS_NO_FILE_LOG=1 (tests, embedding) only a
+    WARNING-level stderr handler is installed and no log file is created.
+    """
+    if not _file_logging_enabled():
+        logging.basicConfig(level=logging.WARNING, stream=sys.stderr)
+        return logging.getLogger("nosis.app")
+
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        logging.FileHandler(LOG_DIR / "app.log", encoding="utf-8", delay=True),
+        logging.StreamHandler(sys.stdout),
+    )
+
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(LOG_FORMATTER)
+
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+
+    listener.start()
+    atexit.register(listener.stop)
+
+    return logging.getLogger("nosis.app")
 
 
 logger = get_logger()
 
+# =============================================================================
+# SHARED UI RESOURCES
+# =============================================================================
+
+@functools.cache
+def get_default_font() -> QFont:
+    """
+    Application default font, built once (QFont needs a QGuiApplication,
+    so it cannot be created at import time).
+    """
+    return QFont(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZE)
+
 # =============================================================================
 # ENVIRONMENT & RUNTIME SAFETY
 # =============================================================================
@@ -79,9 +134,7 @@ def configure_runtime_environment() -> None:
     if sys.version_info < (3, 10):
         raise RuntimeError("NOSIS Desktop requires Python 3.10+")
 
-    # Qt / HiDPI safety
-    os.environ.setdefault("QT_ENABLE_HIGHDPI_SCALING", "1")
-    os.environ.setdefault("QT_AUTO_SCREEN_SCALE_FACTOR", "1")
+    # High-DPI scaling is always on in Qt 6; only the rounding policy remains
     os.environ.setdefault(
         "QT_SCALE_FACTOR_ROUNDING_POLICY",
         "PassThrough",
@@ -108,7 +161,7 @@ class NosisApplication(QApplication):
         configure_runtime_environment()
         super().__init__(argv)
 
-        self._async_loop: Optional[qasync.QEventLoop] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
 
         self._configure_metadata()
         self._configure_ui_defaults()
@@ -127,26 +180,22 @@ class NosisApplication(QApplication):
     # ---------------------------------------------------------------------
 
     def _configure_ui_defaults(self) -> None:
-        self.setAttribute(Qt.ApplicationAttribute.AA_UseHighDpiPixmaps, True)
-
-        font = QFont("Inter")
-        font.setPointSize(10)
-        self.setFont(font)
+        # AA_UseHighDpiPixmaps is always on in Qt 6 — nothing to set
+        self.setFont(get_default_font())
 
     # ---------------------------------------------------------------------
 
     def _configure_icon(self) -> None:
-        icon_path = ASSETS_DIR / "icons" / "nosis.ico"
-        if icon_path.exists():
-            self.setWindowIcon(QIcon(str(icon_path)))
+        if os.path.exists(ICON_PATH_STR):
+            self.setWindowIcon(QIcon(ICON_PATH_STR))
         else:
-            logger.warning("Application icon not found: %s", icon_path)
+            logger.warning("Application icon not found: %s", ICON_PATH_STR)
 
     # ---------------------------------------------------------------------
     # ASYNC INTEGRATION
     # ---------------------------------------------------------------------
 
-    def setup_asyncio(self) -> qasync.QEventLoop:
+    def setup_asyncio(self) -> asyncio.AbstractEventLoop:
         """
         Attach asyncio-compatible event loop to Qt.
 
@@ -155,11 +204,18 @@ class NosisApplication(QApplication):
         - WebSocket streaming
         - gRPC async clients
         - non-blocking UX
+
+        The bridge is chosen via NOSIS_ASYNC_BRIDGE
+        (see core.event_loop.create_qt_event_loop).
         """
         if self._async_loop is None:
-            self._async_loop = qasync.QEventLoop(self)
-            qasync.asyncio.set_event_loop(self._async_loop)
-            logger.info("Asyncio event loop integrated with Qt")
+            self._async_loop = create_qt_event_loop(self)
+
+            asyncio.set_event_loop(self._async_loop)
+            logger.info(
+                "Asyncio event loop integrated with Qt (%s)",
+                type(self._async_loop).__name__,
+            )
         return self._async_loop
 
     # ---------------------------------------------------------------------
@@ -167,6 +223,10 @@ class NosisApplication(QApplication):
     def run(self) -> int:
         """
         Run the application event loop safely.
+
+        With the "native" bridge, run_forever() is QApplication.exec()
+        with asyncio stepped from Qt's dispatcher; with qasync it is
+        qasync's own loop. Both return the application exit code.
         """
         loop = self.setup_asyncio()
         logger.info("NOSIS Desktop event loop started")
@@ -178,7 +238,14 @@ class NosisApplication(QApplication):
 # APPLICATION FACTORY
 # =============================================================================
 
-_app_instance: Optional[NosisApplication] = None
+_app_argv: list[str] = sys.argv
+
+
+@functools.cache
+def _build_application() -> NosisApplication:
+    app = NosisApplication(_app_argv)
+    logger.info("Global application instance created")
+    return app
 
 
 def get_application(argv: Optional[list[str]] = None) -> NosisApplication:
@@ -188,13 +255,13 @@ def get_application(argv: Optional[list[str]] = None) -> NosisApplication:
     Ensures:
     - only one QApplication exists
     - safe reuse in tests or embedded contexts
+
+    argv is only honoured on the first call (lists are unhashable,
+    so it is kept out of the cache key).
     """
-    global _app_instance
+    global _app_argv
 
-    if _app_instance is None:
-        if argv is None:
-            argv = sys.argv
-        _app_instance = NosisApplication(argv)
-        logger.info("Global application instance created")
+    if argv is not None and _build_application.cache_info().currsize == 0:
+        _app_argv = argv
 
-    return _app_instance
+    return _build_application()
@@ -22,10 +22,14 @@ It is the ONLY allowed way for GUI to talk to backend.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import time
 from typing import Any, Dict, Optional
 
 import httpx
+import orjson
+from PyQt6.QtCore import QTimer
 
 from desktop_gui.core.app_state import get_app_state
 from desktop_gui.core.signals import get_signals
@@ -37,6 +41,26 @@ from desktop_gui.core.signals import get_signals
 DEFAULT_BASE_URL = "http://127.0.0.1:8000"
 DEFAULT_TIMEOUT = 60.0
 
+# Connection pool / transport tuning (HTTP/2 multiplexes concurrent calls)
+HTTP2_ENABLED = True
+MAX_KEEPALIVE_CONNECTIONS = 20
+MAX_CONNECTIONS = 40
+KEEPALIVE_EXPIRY = 30.0
+TRANSPORT_RETRIES = 1
+
+# backend_latency_updated is coalesced to at most one emit per interval
+LATENCY_EMIT_INTERVAL_MS = 250
+
+# Content-Type is intentionally absent: httpx sets it for json= bodies,
+# and a client-wide default would break multipart uploads on the shared pool.
+BASE_HEADERS: Dict[str, str] = {
+    "X-Client": "nosis-desktop",
+}
+
+JSON_CONTENT_HEADERS: Dict[str, str] = {
+    "Content-Type": "application/json",
+}
+
 logger = logging.getLogger("nosis.api_client")
 
 # =============================================================================
@@ -59,9 +83,33 @@ class APIClient:
         self._state = get_app_state()
         self._signals = get_signals()
 
+        # Static headers live on the client; only auth varies per session
+        self._base_headers: Dict[str, str] = dict(BASE_HEADERS)
+        self._auth_header: Optional[str] = None
+        self._request_headers: Optional[Dict[str, str]] = None
+        self._json_request_headers: Dict[str, str] = JSON_CONTENT_HEADERS
+
+        self._pending_latency: Optional[int] = None
+        self._latency_timer = QTimer()
+        self._latency_timer.setSingleShot(True)
+        self._latency_timer.setInterval(LATENCY_EMIT_INTERVAL_MS)
+        self._latency_timer.timeout.connect(self._flush_latency)
+
+        # NOTE: http2/limits must be set on the transport — httpx ignores
+        # the client-level arguments once a custom transport is supplied.
         self._client = httpx.AsyncClient(
             base_url=self._base_url,
             timeout=DEFAULT_TIMEOUT,
+            headers=self._base_headers,
+            transport=httpx.AsyncHTTPTransport(
+                http2=HTTP2_ENABLED,
+                limits=httpx.Limits(
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                    max_connections=MAX_CONNECTIONS,
+                    keepalive_expiry=KEEPALIVE_EXPIRY,
+                ),
+                retries=TRANSPORT_RETRIES,
+            ),
         )
 
     # ------------------------------------------------------------------
@@ -82,24 +130,52 @@ class APIClient:
         - error handling
         - latency tracking
         """
-        url = f"{self._base_url}{path}"
+        return orjson.loads(
+            await self._request_raw(method, path, json=json, params=params)
+        )
+
+    async def _request_raw(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> bytes:
+        """
+        Same as _request, but returns the undecoded response body.
+
+        Lets callers of large endpoints decide when (and whether)
+        to pay for full JSON materialization.
+        """
+        # Bodies are pre-serialized with orjson instead of httpx's
+        # stdlib json= path; Content-Type is then set explicitly.
+        if json is None:
+            content = None
+            headers = self._request_headers
+        else:
+            content = orjson.dumps(json)
+            headers = self._json_request_headers
 
-        headers = self._build_headers()
+        start_ns = time.perf_counter_ns()
 
         try:
+            # base_url and static headers are client-level defaults;
+            # only the Authorization header is passed per request.
             response = await self._client.request(
                 method=method,
-                url=url,
-                json=json,
+                url=path,
+                content=content,
                 params=params,
                 headers=headers,
             )
 
-            latency_ms = int(response.elapsed.total_seconds() * 1000)
-            self._signals.backend_latency_updated.emit(latency_ms)
+            # Skip latency bookkeeping entirely when nobody listens
+            if self._signals.receivers(self._signals.backend_latency_updated):
+                self._report_latency((time.perf_counter_ns() - start_ns) // 1_000_000)
 
             response.raise_for_status()
-            return response.json()
+            return response.content
 
         except httpx.HTTPStatusError as exc:
             logger.error("HTTP error %s: %s", exc.response.status_code, exc)
@@ -112,23 +188,44 @@ class APIClient:
             raise
 
     # ------------------------------------------------------------------
-    # HEADERS / AUTH
+    # LATENCY REPORTING
     # ------------------------------------------------------------------
 
-    def _build_headers(self) -> Dict[str, str]:
+    def _report_latency(self, latency_ms: int) -> None:
         """
-        Build request headers.
+        Record latest latency; the UI only sees the most recent value
+        once per LATENCY_EMIT_INTERVAL_MS.
         """
-        headers = {
-            "Content-Type": "application/json",
-            "X-Client": "nosis-desktop",
-        }
+        self._pending_latency = latency_ms
+        if not self._latency_timer.isActive():
+            self._latency_timer.start()
+
+    def _flush_latency(self) -> None:
+        if self._pending_latency is not None:
+            self._signals.backend_latency_updated.emit(self._pending_latency)
+            self._pending_latency = None
+
+    # ------------------------------------------------------------------
+    # HEADERS / AUTH
+    # ------------------------------------------------------------------
 
-        if self._state.user.authenticated:
-            # token handling can be extended later
-            headers["Authorization"] = f"Bearer dummy-token"
+    def set_auth_token(self, token: Optional[str]) -> None:
+        """
+        Update the Authorization header (None clears it).
 
-        return headers
+        Called by AuthBridge on login / refresh / logout.
+        """
+        self._auth_header = f"Bearer {token}" if token else None
+
+        if self._auth_header is None:
+            self._request_headers = None
+            self._json_request_headers = JSON_CONTENT_HEADERS
+        else:
+            self._request_headers = {"Authorization": self._auth_header}
+            self._json_request_headers = {
+                **JSON_CONTENT_HEADERS,
+                **self._request_headers,
+            }
 
     # ------------------------------------------------------------------
     # HEALTH / CONNECTION
@@ -186,6 +283,15 @@ class APIClient:
         """
         return await self._request("GET", "/library")
 
+    async def fetch_library_raw(self) -> bytes:
+        """
+        Fetch user's generated tracks as raw JSON bytes.
+
+        For large libraries the UI can defer / chunk decoding
+        instead of building the whole dict up front.
+        """
+        return await self._request_raw("GET", "/library")
+
     async def delete_track(self, track_id: str) -> None:
         """
         Delete a track from library.
@@ -203,6 +309,9 @@ class APIClient:
     async def load_project(self, project_id: str) -> Dict[str, Any]:
         return await self._request("GET", f"/projects/{project_id}")
 
+    async def load_project_raw(self, project_id: str) -> bytes:
+        return await self._request_raw("GET", f"/projects/{project_id}")
+
     # ------------------------------------------------------------------
     # SHUTDOWN
     # ------------------------------------------------------------------
@@ -215,9 +324,7 @@ class APIClient:
 # GLOBAL SINGLETON ACCESSOR
 # =============================================================================
 
-_api_client: Optional[APIClient] = None
-
-
+@functools.cache
 def get_api_client() -> APIClient:
     """
     Global API client accessor.
@@ -227,7 +334,4 @@ def get_api_client() -> APIClient:
     - connection reuse
     - consistent headers & behavior
     """
-    global _api_client
-    if _api_client is None:
-        _api_client = APIClient()
-    return _api_client
+    return APIClient()
@@ -20,15 +20,53 @@ This module:
 from __future__ import annotations
 
 import asyncio
+import base64
+import functools
 import logging
+import time
 from typing import Optional, Dict, Any
 
+import orjson
+
 from desktop_gui.bridge.api_client import get_api_client
 from desktop_gui.core.app_state import get_app_state
 from desktop_gui.core.signals import get_signals
 
 logger = logging.getLogger("nosis.auth_bridge")
 
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+TOKEN_REFRESH_MARGIN = 60.0        # refresh this many seconds before expiry
+MIN_REFRESH_DELAY = 30.0           # never refresh more often than this
+DEFAULT_REFRESH_DELAY = 60.0 * 10  # fallback when the token has no readable exp
+
+
+def _token_expiry(token: Optional[str]) -> Optional[float]:
+    """
+    Read the `exp` claim (unix seconds) from a JWT without verifying it.
+
+    Returns None for opaque / malformed tokens.
+    """
+    if not token:
+        return None
+
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(orjson.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _user_id(value: Any) -> Optional[str]:
+    """
+    Normalize a backend user id (may be numeric) to the str the
+    user_logged_in signal carries.
+    """
+    return None if value is None else str(value)
+
 
 # =============================================================================
 # AUTH BRIDGE
@@ -76,7 +114,7 @@ class AuthBridge:
 
         self._apply_auth_response(response)
 
-        self._signals.user_logged_in.emit(response.get("user", {}))
+        self._signals.user_logged_in.emit(self._state.user.user_id or "")
         logger.info("User logged in successfully")
 
     async def logout(self) -> None:
@@ -113,10 +151,11 @@ class AuthBridge:
             response = await self._api._request("GET", "/auth/me")
             self._state.set_user(
                 authenticated=True,
+                user_id=_user_id(response.get("id")),
                 username=response.get("username"),
                 plan=response.get("plan", "free"),
             )
-            self._signals.user_logged_in.emit(response)
+            self._signals.user_logged_in.emit(self._state.user.user_id or "")
             return True
 
         except Exception:
@@ -133,16 +172,18 @@ class AuthBridge:
         """
         self._access_token = response.get("access_token")
         self._refresh_token = response.get("refresh_token")
+        self._api.set_auth_token(self._access_token)
 
         user = response.get("user", {})
 
         self._state.set_user(
             authenticated=True,
+            user_id=_user_id(user.get("id")),
             username=user.get("username"),
             plan=user.get("plan", "free"),
         )
 
-        self._start_token_refresh_loop()
+        self._schedule_token_refresh()
 
     def _clear_auth_state(self) -> None:
         """
@@ -150,6 +191,7 @@ class AuthBridge:
         """
         self._access_token = None
         self._refresh_token = None
+        self._api.set_auth_token(None)
 
         if self._refresh_task:
             self._refresh_task.cancel()
@@ -157,6 +199,7 @@ class AuthBridge:
 
         self._state.set_user(
             authenticated=False,
+            user_id=None,
             username=None,
             plan="free",
         )
@@ -165,36 +208,45 @@ class AuthBridge:
     # TOKEN REFRESH
     # ------------------------------------------------------------------
 
-    def _start_token_refresh_loop(self) -> None:
+    def _schedule_token_refresh(self) -> None:
         """
-        Start background token refresh loop.
+        Schedule the next refresh shortly before the access token expires.
         """
         if self._refresh_task:
-            return
+            self._refresh_task.cancel()
+
+        self._refresh_task = asyncio.create_task(
+            self._sleep_then_refresh(self._next_refresh_delay())
+        )
 
-        self._refresh_task = asyncio.create_task(self._refresh_loop())
+    def _next_refresh_delay(self) -> float:
+        expiry = _token_expiry(self._access_token)
+        if expiry is None:
+            return DEFAULT_REFRESH_DELAY
 
-    async def _refresh_loop(self) -> None:
+        return max(MIN_REFRESH_DELAY, expiry - time.time() - TOKEN_REFRESH_MARGIN)
+
+    async def _sleep_then_refresh(self, delay: float) -> None:
         """
-        Periodically refresh access token.
+        Wait until the refresh deadline, refresh once, then reschedule.
         """
         try:
-            while True:
-                await asyncio.sleep(60 * 10)  # refresh every 10 minutes
+            await asyncio.sleep(delay)
 
-                if not self._refresh_token:
-                    return
+            if not self._refresh_token:
+                return
 
-                logger.debug("Refreshing access token")
+            logger.debug("Refreshing access token")
 
-                response = await self._api._request(
-                    "POST",
-                    "/auth/refresh",
-                    json={"refresh_token": self._refresh_token},
-                )
+            response = await self._api._request(
+                "POST",
+                "/auth/refresh",
+                json={"refresh_token": self._refresh_token},
+            )
 
-                self._access_token = response.get("access_token")
-                logger.info("Access token refreshed")
+            self._access_token = response.get("access_token")
+            self._api.set_auth_token(self._access_token)
+            logger.info("Access token refreshed")
 
         except asyncio.CancelledError:
             return
@@ -203,6 +255,11 @@ class AuthBridge:
             logger.warning("Token refresh failed: %s", exc)
             self._signals.user_logged_out.emit()
             self._clear_auth_state()
+            return
+
+        # Detach from the finished task before scheduling the next one
+        self._refresh_task = None
+        self._schedule_token_refresh()
 
     # ------------------------------------------------------------------
     # HEADERS INTEGRATION
@@ -221,9 +278,7 @@ class AuthBridge:
 # GLOBAL SINGLETON ACCESSOR
 # =============================================================================
 
-_auth_bridge: Optional[AuthBridge] = None
-
-
+@functools.cache
 def get_auth_bridge() -> AuthBridge:
     """
     Global accessor for AuthBridge.
@@ -232,7 +287,4 @@ def get_auth_bridge() -> AuthBridge:
     - single auth controller
     - consistent user state
     """
-    global _auth_bridge
-    if _auth_bridge is None:
-        _auth_bridge = AuthBridge()
-    return _auth_bridge
+    return AuthBridge()
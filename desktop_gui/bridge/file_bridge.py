@@ -20,12 +20,14 @@ This module:
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import mimetypes
+import os
 from pathlib import Path
-from typing import Optional, Dict, Any, Iterable
+from typing import Optional, Dict, Any, Iterable, AsyncIterator
 
-import httpx
+import aiofiles
 
 from desktop_gui.bridge.api_client import get_api_client
 from desktop_gui.core.signals import get_signals
@@ -33,25 +35,40 @@ from desktop_gui.core.app_state import get_app_state
 
 logger = logging.getLogger("nosis.file_bridge")
 
+# Load the mime database eagerly at import rather than lazily on the
+# first upload (which would run inside the event loop).
+mimetypes.init()
+
 
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
 
 MAX_FILE_SIZE_MB = 200
-ALLOWED_AUDIO_TYPES = {
+MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB << 20
+
+ALLOWED_AUDIO_TYPES = frozenset({
     "audio/wav",
     "audio/mpeg",
     "audio/mp3",
     "audio/flac",
     "audio/ogg",
-}
+})
 
-ALLOWED_IMAGE_TYPES = {
+ALLOWED_IMAGE_TYPES = frozenset({
     "image/png",
     "image/jpeg",
     "image/webp",
-}
+})
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # bytes per async disk read
+MAX_CONCURRENT_UPLOADS = 4       # parallel uploads over the shared pool
+
+# Percent-encode the quote and control characters (CR/LF included) in the
+# multipart filename, as browsers do: a raw CR/LF would inject headers.
+MULTIPART_FILENAME_ESCAPES = str.maketrans(
+    {'"': "%22", **{chr(c): f"%{c:02X}" for c in range(0x20)}, "\x7f": "%7F"}
+)
 
 
 # =============================================================================
@@ -91,22 +108,54 @@ class FileBridge:
             - "image"
             - "other"
         """
-        for path in paths:
-            await self._upload_single_file(path, category)
+        paths = list(paths)
+        if not paths:
+            return
+
+        # Validate everything before the first byte is sent, so a bad file
+        # later in the list never cancels uploads already streaming
+        mimes = [self._validate_file(path, category) for path in paths]
+
+        label = paths[0].name if len(paths) == 1 else f"{len(paths)} files"
+        self._signals.notification.emit(f"Uploading {label}", "info")
+
+        limiter = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
+
+        async def upload(path: Path, mime: Optional[str]) -> None:
+            async with limiter:
+                await self._upload_single_file(path, mime, category)
+
+        # First failure cancels sibling uploads and propagates unchanged
+        # (no ExceptionGroup wrapping); the cancelled siblings are awaited
+        # so their own errors are retrieved
+        tasks = [
+            asyncio.ensure_future(upload(path, mime))
+            for path, mime in zip(paths, mimes)
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        self._signals.notification.emit(f"Uploaded {label}", "success")
 
     # ------------------------------------------------------------------
     # VALIDATION
     # ------------------------------------------------------------------
 
-    def _validate_file(self, path: Path, category: str) -> None:
+    def _validate_file(self, path: Path, category: str) -> Optional[str]:
         """
         Validate file before upload.
+
+        Returns the guessed mime type so callers don't look it up twice.
         """
-        if not path.exists():
-            raise FileNotFoundError(path)
+        # One stat() syscall covers both existence and size
+        st = path.stat()  # raises FileNotFoundError for missing files
 
-        size_mb = path.stat().st_size / (1024 * 1024)
-        if size_mb > MAX_FILE_SIZE_MB:
+        if st.st_size > MAX_FILE_SIZE_BYTES:
             raise ValueError(f"File too large: {path.name}")
 
         mime, _ = mimetypes.guess_type(path)
@@ -117,6 +166,8 @@ class FileBridge:
         if category == "image" and mime not in ALLOWED_IMAGE_TYPES:
             raise ValueError(f"Unsupported image type: {mime}")
 
+        return mime
+
     # ------------------------------------------------------------------
     # UPLOAD LOGIC
     # ------------------------------------------------------------------
@@ -124,39 +175,68 @@ class FileBridge:
     async def _upload_single_file(
         self,
         path: Path,
+        mime: Optional[str],
         category: str,
     ) -> None:
         """
-        Upload a single file with progress reporting.
+        Upload a single, already validated file.
+
+        UI notifications are aggregated by upload_reference_files.
         """
-        self._validate_file(path, category)
+        mime = mime or "application/octet-stream"
 
         logger.info("Uploading file: %s", path.name)
 
-        self._signals.notification.emit(
-            f"Uploading {path.name}", "info"
+        boundary = os.urandom(16).hex()
+
+        headers = {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+        if self._api._request_headers:
+            headers.update(self._api._request_headers)
+
+        # Reuse the pooled API client (keep-alive / HTTP/2) instead of
+        # paying a fresh TCP+TLS handshake per file.
+        response = await self._api._client.post(
+            "/files/upload",
+            content=self._multipart_stream(path, mime, category, boundary),
+            headers=headers,
+            timeout=None,
         )
 
-        async with httpx.AsyncClient(timeout=None) as client:
-            with path.open("rb") as f:
-                files = {
-                    "file": (path.name, f, mimetypes.guess_type(path)[0]),
-                    "category": (None, category),
-                }
+        response.raise_for_status()
 
-                response = await client.post(
-                    f"{self._api._base_url}/files/upload",
-                    files=files,
-                    headers=self._api._build_headers(),
-                )
+        logger.info("File uploaded successfully: %s", path.name)
 
-                response.raise_for_status()
+    async def _multipart_stream(
+        self,
+        path: Path,
+        mime: str,
+        category: str,
+        boundary: str,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream a multipart/form-data body without blocking the event loop.
 
-        self._signals.notification.emit(
-            f"Uploaded {path.name}", "success"
-        )
+        File contents are read in chunks via aiofiles, so large uploads
+        never stall the Qt/asyncio loop on disk I/O.
+        """
+        filename = path.name.translate(MULTIPART_FILENAME_ESCAPES)
 
-        logger.info("File uploaded successfully: %s", path.name)
+        yield (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+            f"Content-Type: {mime}\r\n\r\n"
+        ).encode()
+
+        async with aiofiles.open(path, "rb") as f:
+            while chunk := await f.read(UPLOAD_CHUNK_SIZE):
+                yield chunk
+
+        yield (
+            f"\r\n--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="category"\r\n\r\n'
+            f"{category}\r\n"
+            f"--{boundary}--\r\n"
+        ).encode()
 
     # ------------------------------------------------------------------
     # CONVENIENCE HELPERS
@@ -173,9 +253,7 @@ class FileBridge:
 # GLOBAL SINGLETON ACCESSOR
 # =============================================================================
 
-_file_bridge: Optional[FileBridge] = None
-
-
+@functools.cache
 def get_file_bridge() -> FileBridge:
     """
     Global accessor for FileBridge.
@@ -184,7 +262,4 @@ def get_file_bridge() -> FileBridge:
     - one upload controller
     - consistent validation rules
     """
-    global _file_bridge
-    if _file_bridge is None:
-        _file_bridge = FileBridge()
-    return _file_bridge
+    return FileBridge()
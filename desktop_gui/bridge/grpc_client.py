@@ -22,12 +22,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Optional, AsyncIterator, Dict, Any
+import time
+from typing import TYPE_CHECKING, Callable, Optional, AsyncIterator, Dict, Any, List
 
-import grpc
-import grpc.aio
-
-from desktop_gui.core.signals import get_signals
+from desktop_gui.core.config import UIConfig
+from desktop_gui.core.signals import GenerationPreview, get_signals
 from desktop_gui.core.app_state import get_app_state
 
 # =============================================================================
@@ -36,8 +35,27 @@ from desktop_gui.core.app_state import get_app_state
 
 DEFAULT_GRPC_ENDPOINT = "localhost:50051"
 
+# Channel pool: HTTP/2 servers typically cap concurrent streams at ~100
+# per connection, so extra channels are opened beyond that load.
+MAX_STREAMS_PER_CHANNEL = 100
+IDLE_CHANNEL_TTL = 180.0  # seconds before an idle pooled channel is closed
+
+# Simulated stream (until real stubs land): messages are built once
+FAKE_STREAM_INTERVAL = 0.3  # seconds between progress messages
+PROGRESS_MESSAGES = tuple(
+    {"type": "progress", "value": i / 10.0} for i in range(1, 11)
+)
+PREVIEW_MESSAGE = {
+    "type": "preview",
+    "data": {"audio_chunk": b"..."},
+}
+
 logger = logging.getLogger("nosis.grpc_client")
 
+# grpc is a large C extension; import it only when a channel is opened
+if TYPE_CHECKING:
+    import grpc.aio
+
 # =============================================================================
 # GRPC CLIENT
 # =============================================================================
@@ -57,13 +75,49 @@ class GRPCGenerationClient:
     - Progressive previews
     """
 
-    def __init__(self, endpoint: str = DEFAULT_GRPC_ENDPOINT):
+    __slots__ = (
+        "_endpoint", "_config", "_state", "_signals",
+        "_channel", "_connected", "_connect_lock",
+        "_active_streams", "_reserved_streams", "_idle_since",
+        "_emit_progress", "_emit_preview", "_emit_finished", "_emit_failed",
+        "_store_progress",
+        "_dispatch",
+    )
+
+    def __init__(
+        self,
+        endpoint: str = DEFAULT_GRPC_ENDPOINT,
+        config: Optional[UIConfig] = None,
+    ):
         self._endpoint = endpoint
+        self._config = config or UIConfig()
         self._state = get_app_state()
         self._signals = get_signals()
 
         self._channel: Optional[grpc.aio.Channel] = None
         self._connected: bool = False
+        # Concurrent generate() calls on a fresh client share one channel
+        self._connect_lock = asyncio.Lock()
+
+        # Pool bookkeeping (see get_grpc_client). Reserved slots are handed
+        # out by the accessor and claimed when generate() starts running.
+        self._active_streams: int = 0
+        self._reserved_streams: int = 0
+        self._idle_since: float = time.monotonic()
+
+        # Hot-path callables are bound once instead of per message
+        s = self._signals
+        self._emit_progress = s.generation_progress.emit
+        self._emit_preview = s.generation_preview.emit
+        self._emit_finished = s.generation_finished.emit
+        self._emit_failed = s.generation_failed.emit
+        self._store_progress = self._state.update_generation_progress
+
+        self._dispatch: Dict[str, Callable[[Dict[str, Any]], None]] = {
+            "progress": self._on_progress,
+            "preview": self._on_preview,
+            "error": self._on_error,
+        }
 
     # ------------------------------------------------------------------
     # CONNECTION MANAGEMENT
@@ -76,22 +130,49 @@ class GRPCGenerationClient:
         if self._connected:
             return
 
-        self._channel = grpc.aio.insecure_channel(self._endpoint)
-        await self._channel.channel_ready()
+        async with self._connect_lock:
+            if self._connected:
+                return
+
+            import grpc.aio
+
+            # Keepalive + flow-control tuning so long preview streams neither
+            # stall on small windows nor die silently behind NAT timeouts.
+            channel = grpc.aio.insecure_channel(
+                self._endpoint,
+                options=self._config.grpc_channel_options(),
+            )
+            try:
+                await channel.channel_ready()
+            except BaseException:
+                await channel.close()
+                raise
+
+            self._channel = channel
+            self._connected = True
 
-        self._connected = True
         logger.info("Connected to gRPC backend at %s", self._endpoint)
         self._signals.backend_connected.emit()
 
     async def close(self) -> None:
         """
-        Gracefully close channel.
+        Gracefully close channel and leave the pool.
+        """
+        _discard_from_pool(self)
+
+        if self._channel:
+            await self._close_channel()
+            self._signals.backend_disconnected.emit()
+
+    async def _close_channel(self) -> None:
+        """
+        Close the channel without UI notification (pool eviction).
         """
         if self._channel:
             await self._channel.close()
+            self._channel = None
             self._connected = False
-            logger.info("gRPC channel closed")
-            self._signals.backend_disconnected.emit()
+            logger.info("gRPC channel closed: %s", self._endpoint)
 
     # ------------------------------------------------------------------
     # GENERATION PIPELINE
@@ -112,27 +193,35 @@ class GRPCGenerationClient:
         The request dict is converted to protobuf upstream
         (bridge responsibility).
         """
+        if self._reserved_streams:
+            self._reserved_streams -= 1
+        self._active_streams += 1
+        try:
+            await self.connect()
 
-        await self.connect()
+            self._signals.generation_started.emit()
+            self._state.start_generation()
 
-        self._signals.generation_started.emit()
-        self._state.start_generation()
+            try:
+                result = await self._run_generation_stream(request)
+                self._emit_finished(result)
+                self._state.finish_generation()
+                return result
 
-        try:
-            result = await self._run_generation_stream(request)
-            self._signals.generation_finished.emit(result)
-            self._state.finish_generation()
-            return result
+            except asyncio.CancelledError:
+                self._signals.generation_cancelled.emit()
+                raise
 
-        except asyncio.CancelledError:
-            self._signals.generation_cancelled.emit()
-            raise
+            except Exception as exc:
+                logger.exception("Generation failed")
+                self._emit_failed(str(exc))
+                self._state.fail_generation(str(exc))
+                raise
 
-        except Exception as exc:
-            logger.exception("Generation failed")
-            self._signals.generation_failed.emit(str(exc))
-            self._state.fail_generation(str(exc))
-            raise
+        finally:
+            self._active_streams -= 1
+            if not self._active_streams:
+                self._idle_since = time.monotonic()
 
     # ------------------------------------------------------------------
     # STREAM HANDLING
@@ -171,17 +260,15 @@ class GRPCGenerationClient:
 
         Replace with real gRPC stream.
         """
-        for i in range(1, 11):
-            await asyncio.sleep(0.3)
-            yield {
-                "type": "progress",
-                "value": i / 10.0,
-            }
-
-        yield {
-            "type": "preview",
-            "data": {"audio_chunk": b"..."},
-        }
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        # Sleep to absolute deadlines so per-step overhead doesn't drift
+        for i, message in enumerate(PROGRESS_MESSAGES, start=1):
+            await asyncio.sleep(max(0.0, start + FAKE_STREAM_INTERVAL * i - loop.time()))
+            yield message
+
+        yield PREVIEW_MESSAGE
 
     # ------------------------------------------------------------------
     # MESSAGE DISPATCH
@@ -191,35 +278,95 @@ class GRPCGenerationClient:
         """
         Dispatch stream messages to UI via signals.
         """
-        msg_type = message.get("type")
+        handler = self._dispatch.get(message.get("type"))
+        if handler is not None:
+            handler(message)
 
-        if msg_type == "progress":
-            value = float(message.get("value", 0.0))
-            self._signals.generation_progress.emit(value)
-            self._state.update_generation_progress(value)
+    def _on_progress(self, message: Dict[str, Any]) -> None:
+        value = float(message.get("value", 0.0))
+        self._emit_progress(value)
+        self._store_progress(value)
 
-        elif msg_type == "preview":
-            self._signals.generation_preview.emit(message.get("data", {}))
+    def _on_preview(self, message: Dict[str, Any]) -> None:
+        data = message.get("data", {})
+        self._emit_preview(GenerationPreview(
+            data.get("chunk_id"), data.get("audio_chunk"), data.get("sample_rate"),
+        ))
 
-        elif msg_type == "error":
-            raise RuntimeError(message.get("error"))
+    def _on_error(self, message: Dict[str, Any]) -> None:
+        raise RuntimeError(message.get("error"))
 
 # =============================================================================
-# GLOBAL SINGLETON ACCESSOR
+# GLOBAL CHANNEL POOL ACCESSOR
 # =============================================================================
 
-_grpc_client: Optional[GRPCGenerationClient] = None
+_pool: Dict[str, List[GRPCGenerationClient]] = {}
+_eviction_task: Optional[asyncio.Task] = None
 
 
-def get_grpc_client() -> GRPCGenerationClient:
+def get_grpc_client(endpoint: str = DEFAULT_GRPC_ENDPOINT) -> GRPCGenerationClient:
     """
-    Global accessor for gRPC generation client.
+    Global accessor for gRPC generation clients.
 
     Ensures:
-    - single channel per app
-    - predictable lifecycle
+    - least-loaded channel per endpoint is reused
+    - a new channel once every pooled one carries MAX_STREAMS_PER_CHANNEL
+    - idle surplus channels are closed after IDLE_CHANNEL_TTL
+
+    Each call reserves one stream slot on the returned client, claimed by
+    its next generate(), so clients handed out before their streams start
+    still count toward the per-channel limit.
+    """
+    clients = _pool.setdefault(endpoint, [])
+
+    if clients:
+        client = min(clients, key=_stream_load)
+        if _stream_load(client) < MAX_STREAMS_PER_CHANNEL:
+            client._reserved_streams += 1
+            return client
+
+    client = GRPCGenerationClient(endpoint)
+    client._reserved_streams += 1
+    clients.append(client)
+    _ensure_eviction_task()
+    return client
+
+
+def _stream_load(client: GRPCGenerationClient) -> int:
+    return client._active_streams + client._reserved_streams
+
+
+def _discard_from_pool(client: GRPCGenerationClient) -> None:
+    clients = _pool.get(client._endpoint)
+    if clients and client in clients:
+        clients.remove(client)
+        if not clients:
+            del _pool[client._endpoint]
+
+
+def _ensure_eviction_task() -> None:
+    global _eviction_task
+
+    if _eviction_task is not None and not _eviction_task.done():
+        return
+
+    try:
+        _eviction_task = asyncio.get_running_loop().create_task(_evict_idle_channels())
+    except RuntimeError:
+        # No running loop yet; eviction starts with the next pooled client
+        _eviction_task = None
+
+
+async def _evict_idle_channels() -> None:
+    """
+    Periodically close idle channels, keeping one warm per endpoint.
     """
-    global _grpc_client
-    if _grpc_client is None:
-        _grpc_client = GRPCGenerationClient()
-    return _grpc_client
+    while _pool:
+        await asyncio.sleep(IDLE_CHANNEL_TTL / 3)
+
+        now = time.monotonic()
+        for clients in list(_pool.values()):
+            for client in clients[1:]:
+                if not _stream_load(client) and now - client._idle_since > IDLE_CHANNEL_TTL:
+                    _discard_from_pool(client)
+                    await client._close_channel()
@@ -19,13 +19,15 @@ This module:
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, Union
 
+import msgspec
+import orjson
 import websockets
+from PyQt6.QtCore import QTimer
 
-from desktop_gui.core.signals import get_signals
+from desktop_gui.core.signals import GenerationPreview, get_signals
 from desktop_gui.core.app_state import get_app_state
 
 # =============================================================================
@@ -34,9 +36,91 @@ from desktop_gui.core.app_state import get_app_state
 
 DEFAULT_WS_URL = "ws://127.0.0.1:8000/ws/progress"
 HEARTBEAT_INTERVAL = 10.0  # seconds
+RECONNECT_BACKOFF_INITIAL = 2.0  # seconds, doubled per failed attempt
+RECONNECT_BACKOFF_MAX = 30.0
+PROGRESS_FLUSH_INTERVAL_MS = 16  # ~60 Hz cap on progress signals
+
+# Frames are small JSON events: deflate costs more CPU than it saves,
+# and keep-alive is handled by our own _heartbeat, not library pings.
+WS_CONNECT_OPTIONS: Dict[str, Any] = {
+    "compression": None,
+    "max_size": 2**20,
+    "write_limit": 2**16,
+    "ping_interval": None,
+    "ping_timeout": None,
+}
+
+# Binary preview frame: b"P" + uint32 little-endian length + raw audio.
+# Audio bypasses JSON/base64 entirely.
+PREVIEW_FRAME_TAG = b"P"
+PREVIEW_HEADER_SIZE = 5
+
+# Outbound control frames go through one writer task
+OUTBOUND_QUEUE_SIZE = 1024
+OUTBOUND_BATCH_SIZE = 16  # frames written per writer wake-up
+
+# Frames buffered between socket and dispatcher; when full, reading
+# stops and the backend is throttled by TCP flow control.
+RECEIVE_QUEUE_SIZE = 64
+
+# Queued by _run after the receiver stops so the consumer drains and exits
+_END_OF_STREAM = object()
+
+# Control frames never change; serialize them once. They stay text
+# frames so the backend protocol is unchanged.
+PING_MESSAGE = orjson.dumps({"type": "ping"}).decode()
+CANCEL_MESSAGE = orjson.dumps({"type": "cancel"}).decode()
 
 logger = logging.getLogger("nosis.ws_client")
 
+# =============================================================================
+# MESSAGE SCHEMA
+# =============================================================================
+# Inbound JSON events, tagged by their "type" field. Decoding straight
+# into typed structs skips the intermediate dict and float() coercion.
+
+class ProgressMessage(msgspec.Struct, tag_field="type", tag="progress"):
+    value: float = 0.0
+
+
+class PreviewMessage(msgspec.Struct, tag_field="type", tag="preview"):
+    data: Dict[str, Any] = {}
+
+
+class StatusMessage(msgspec.Struct, tag_field="type", tag="status"):
+    pass
+
+
+class ErrorMessage(msgspec.Struct, tag_field="type", tag="error"):
+    error: str = "Unknown error"
+
+
+class CompletedMessage(msgspec.Struct, tag_field="type", tag="completed"):
+    pass
+
+
+WSMessage = Union[
+    ProgressMessage,
+    PreviewMessage,
+    StatusMessage,
+    ErrorMessage,
+    CompletedMessage,
+]
+
+# Lax mode keeps the old float() coercion ("0.5" -> 0.5) for progress values
+_DECODER = msgspec.json.Decoder(WSMessage, strict=False)
+
+
+class _Envelope(msgspec.Struct):
+    type: str = ""
+
+
+# Tag-only decode for frames that failed full validation
+_ENVELOPE_DECODER = msgspec.json.Decoder(_Envelope)
+# Malformed frames of these types still end the generation; others are dropped
+TERMINAL_MESSAGE_TYPES = frozenset({"error", "completed"})
+MALFORMED_MESSAGE_ERROR = "Malformed message from backend"
+
 # =============================================================================
 # WEBSOCKET CLIENT
 # =============================================================================
@@ -53,6 +137,17 @@ class WebSocketClient:
     - Event-driven UI integration
     """
 
+    __slots__ = (
+        "_url", "_signals", "_state",
+        "_ws", "_task", "_heartbeat_task", "_running", "_backoff",
+        "_out_queue", "_writer_task",
+        "_progress_value", "_progress_timer",
+        "_emit_progress", "_emit_preview",
+        "_emit_finished", "_emit_failed",
+        "_store_progress", "_finish_generation", "_fail_generation",
+        "_dispatch",
+    )
+
     def __init__(self, url: str = DEFAULT_WS_URL):
         self._url = url
         self._signals = get_signals()
@@ -60,7 +155,37 @@ class WebSocketClient:
 
         self._ws: Optional[websockets.WebSocketClientProtocol] = None
         self._task: Optional[asyncio.Task] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._out_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
         self._running: bool = False
+        self._backoff: float = RECONNECT_BACKOFF_INITIAL
+
+        # Progress frames are coalesced: only the latest value is published,
+        # at most once per PROGRESS_FLUSH_INTERVAL_MS.
+        self._progress_value: Optional[float] = None
+        self._progress_timer = QTimer()
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(PROGRESS_FLUSH_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
+        # Hot-path callables are bound once instead of per message
+        s = self._signals
+        self._emit_progress = s.generation_progress.emit
+        self._emit_preview = s.generation_preview.emit
+        self._emit_finished = s.generation_finished.emit
+        self._emit_failed = s.generation_failed.emit
+        self._store_progress = self._state.update_generation_progress
+        self._finish_generation = self._state.finish_generation
+        self._fail_generation = self._state.fail_generation
+
+        self._dispatch: Dict[type, Callable[[Any, str | bytes], None]] = {
+            ProgressMessage: self._on_progress,
+            PreviewMessage: self._on_preview,
+            StatusMessage: self._on_status,
+            ErrorMessage: self._on_error,
+            CompletedMessage: self._on_completed,
+        }
 
     # ------------------------------------------------------------------
     # LIFECYCLE
@@ -75,6 +200,12 @@ class WebSocketClient:
 
         self._running = True
         self._task = asyncio.create_task(self._run())
+        # One heartbeat task for the client's lifetime, not per reconnect
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
+
+        # Single writer: heartbeat / cancel never race on ws.send()
+        self._out_queue = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+        self._writer_task = asyncio.create_task(self._writer_loop())
         logger.info("WebSocket client started")
 
     async def stop(self) -> None:
@@ -86,6 +217,12 @@ class WebSocketClient:
         if self._task:
             self._task.cancel()
 
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+
+        if self._writer_task:
+            self._writer_task.cancel()
+
         if self._ws:
             await self._ws.close()
 
@@ -102,16 +239,31 @@ class WebSocketClient:
         while self._running:
             try:
                 logger.info("Connecting to WebSocket: %s", self._url)
-                async with websockets.connect(self._url) as ws:
+                async with websockets.connect(self._url, **WS_CONNECT_OPTIONS) as ws:
                     self._ws = ws
+                    self._backoff = RECONNECT_BACKOFF_INITIAL
                     self._signals.backend_connected.emit()
 
-                    heartbeat = asyncio.create_task(self._heartbeat())
-
-                    async for message in ws:
-                        await self._handle_message(message)
-
-                    heartbeat.cancel()
+                    queue: asyncio.Queue = asyncio.Queue(maxsize=RECEIVE_QUEUE_SIZE)
+                    receiver = asyncio.create_task(self._receive_into(ws, queue))
+                    consumer = asyncio.create_task(self._drain_queue(queue))
+
+                    # A closed connection ends the receiver; frames already
+                    # queued (e.g. "completed") are dispatched before the
+                    # error falls through to reconnect.
+                    try:
+                        await asyncio.wait(
+                            (receiver, consumer),
+                            return_when=asyncio.FIRST_COMPLETED,
+                        )
+                        if not consumer.done():
+                            await queue.put(_END_OF_STREAM)
+                        await consumer
+                        receiver.result()
+                    finally:
+                        self._ws = None
+                        receiver.cancel()
+                        consumer.cancel()
 
             except asyncio.CancelledError:
                 break
@@ -119,7 +271,30 @@ class WebSocketClient:
             except Exception as exc:
                 logger.warning("WebSocket error: %s", exc)
                 self._signals.backend_disconnected.emit()
-                await asyncio.sleep(2.0)  # reconnect backoff
+
+                # Exponential backoff so a down backend isn't hammered
+                await asyncio.sleep(self._backoff)
+                self._backoff = min(self._backoff * 2, RECONNECT_BACKOFF_MAX)
+
+    async def _receive_into(self, ws, queue: asyncio.Queue) -> None:
+        """
+        Producer: move raw frames from the socket into the bounded queue.
+
+        Plain recv() loop, no async-iterator protocol per frame.
+        """
+        while self._running:
+            await queue.put(await ws.recv())
+
+    async def _drain_queue(self, queue: asyncio.Queue) -> None:
+        """
+        Consumer: decode and dispatch frames in arrival order, until the
+        end-of-stream marker.
+        """
+        while True:
+            raw = await queue.get()
+            if raw is _END_OF_STREAM:
+                return
+            await self._handle_message(raw)
 
     # ------------------------------------------------------------------
     # HEARTBEAT
@@ -128,49 +303,134 @@ class WebSocketClient:
     async def _heartbeat(self) -> None:
         """
         Periodic ping to keep connection alive.
+
+        Survives reconnects: while no connection is open it just sleeps.
         """
-        while self._running and self._ws:
+        while self._running:
+            if self._ws is not None:
+                self._enqueue(PING_MESSAGE)
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+
+    # ------------------------------------------------------------------
+    # OUTBOUND
+    # ------------------------------------------------------------------
+
+    def _enqueue(self, frame: str) -> None:
+        try:
+            self._out_queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            logger.warning("WS outbound queue full; dropping frame")
+
+    async def _writer_loop(self) -> None:
+        """
+        Drain queued control frames, up to OUTBOUND_BATCH_SIZE per wake-up.
+
+        Frames are still sent one per WS message: the backend protocol is
+        one JSON object per message, so they are not merged into one frame.
+        """
+        queue = self._out_queue
+
+        while self._running:
+            batch = [await queue.get()]
+            while len(batch) < OUTBOUND_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            ws = self._ws
+            if ws is None:
+                continue  # disconnected: control frames are moot
+
             try:
-                await self._ws.send(json.dumps({"type": "ping"}))
-                await asyncio.sleep(HEARTBEAT_INTERVAL)
+                for frame in batch:
+                    await ws.send(frame)
             except Exception:
-                break
+                pass  # the receive loop handles the disconnect
 
     # ------------------------------------------------------------------
     # MESSAGE HANDLING
     # ------------------------------------------------------------------
 
-    async def _handle_message(self, raw: str) -> None:
+    async def _handle_message(self, raw: str | bytes) -> None:
         """
         Parse and dispatch incoming messages.
+
+        Binary preview frames are unpacked directly; everything else is
+        JSON decoded into the tagged WSMessage structs.
         """
+        if isinstance(raw, bytes) and raw[:1] == PREVIEW_FRAME_TAG:
+            self._on_preview_frame(raw)
+            return
+
         try:
-            data: Dict[str, Any] = json.loads(raw)
-        except json.JSONDecodeError:
+            msg = _DECODER.decode(raw)
+        except msgspec.ValidationError as exc:
+            logger.warning("Unexpected WS message (%s): %s", exc, raw)
+            # A bad terminal event must not leave the generation hanging:
+            # surface it as a generic failure. Bad progress / preview /
+            # status frames are just dropped.
+            if self._message_type(raw) in TERMINAL_MESSAGE_TYPES:
+                self._on_error(ErrorMessage(MALFORMED_MESSAGE_ERROR), raw)
+            return
+        except msgspec.DecodeError:
             logger.warning("Invalid WS message: %s", raw)
             return
 
-        msg_type = data.get("type")
+        self._dispatch[type(msg)](msg, raw)
 
-        if msg_type == "progress":
-            value = float(data.get("value", 0.0))
-            self._signals.generation_progress.emit(value)
-            self._state.update_generation_progress(value)
-
-        elif msg_type == "preview":
-            self._signals.generation_preview.emit(data.get("data", {}))
-
-        elif msg_type == "status":
-            logger.info("Backend status: %s", data)
-
-        elif msg_type == "error":
-            error = data.get("error", "Unknown error")
-            self._signals.generation_failed.emit(error)
-            self._state.fail_generation(error)
+    @staticmethod
+    def _message_type(raw: str | bytes) -> str:
+        try:
+            return _ENVELOPE_DECODER.decode(raw).type
+        except msgspec.ValidationError:
+            return ""
+
+    # Non-progress handlers publish pending progress first to keep ordering
+
+    def _on_progress(self, msg: ProgressMessage, raw: str | bytes) -> None:
+        self._progress_value = msg.value
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _on_preview(self, msg: PreviewMessage, raw: str | bytes) -> None:
+        self._flush_progress()
+        data = msg.data
+        self._emit_preview(GenerationPreview(
+            data.get("chunk_id"), data.get("audio_chunk"), data.get("sample_rate"),
+        ))
+
+    def _on_preview_frame(self, raw: bytes) -> None:
+        self._flush_progress()
+        length = int.from_bytes(raw[1:PREVIEW_HEADER_SIZE], "little")
+        # memoryview slice: the audio chunk is not copied out of the frame
+        audio = memoryview(raw)[PREVIEW_HEADER_SIZE:PREVIEW_HEADER_SIZE + length]
+        self._emit_preview(GenerationPreview(None, audio))
+
+    def _on_status(self, msg: StatusMessage, raw: str | bytes) -> None:
+        self._flush_progress()
+        logger.info("Backend status: %s", raw)
+
+    def _on_error(self, msg: ErrorMessage, raw: str | bytes) -> None:
+        self._flush_progress()
+        self._emit_failed(msg.error)
+        self._fail_generation(msg.error)
+
+    def _on_completed(self, msg: CompletedMessage, raw: str | bytes) -> None:
+        self._flush_progress()
+        # Result metadata is open-ended; decode it in full (once per run)
+        self._emit_finished(orjson.loads(raw))
+        self._finish_generation()
+
+    def _flush_progress(self) -> None:
+        """
+        Publish the latest pending progress value (if any).
+        """
+        value = self._progress_value
+        if value is None:
+            return
 
-        elif msg_type == "completed":
-            self._signals.generation_finished.emit(data)
-            self._state.finish_generation()
+        self._progress_value = None
+        self._progress_timer.stop()
+        self._emit_progress(value)
+        self._store_progress(value)
 
     # ------------------------------------------------------------------
     # SEND CONTROL MESSAGES
@@ -181,7 +441,7 @@ class WebSocketClient:
         Request generation cancellation.
         """
         if self._ws:
-            await self._ws.send(json.dumps({"type": "cancel"}))
+            self._enqueue(CANCEL_MESSAGE)
             self._signals.generation_cancelled.emit()
 
 
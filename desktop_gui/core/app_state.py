@@ -19,17 +19,28 @@ Design philosophy:
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
-from dataclasses import dataclass, field
+import asyncio
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+from dataclasses import dataclass, field, replace
 
-from PyQt6.QtCore import QObject, pyqtSignal, QMutex, QMutexLocker
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from desktop_gui.core.signals import get_signals
+
+logger = logging.getLogger("nosis.app_state")
+
+# Set to "1" to always emit the generic state_changed signal
+STATE_DEBUG_ENV = "NOSIS_STATE_DEBUG"
 
 
 # =============================================================================
 # STATE DOMAIN MODELS
 # =============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserState:
     user_id: Optional[str] = None
     username: Optional[str] = None
@@ -37,7 +48,7 @@ class UserState:
     authenticated: bool = False
     credits: Optional[int] = None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProjectState:
     project_id: Optional[str] = None
     title: str = "Untitled Project"
@@ -45,26 +56,70 @@ class ProjectState:
     mode: str = "simple"            # simple | pro
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GenerationState:
     in_progress: bool = False
     progress: float = 0.0
     last_error: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BackendState:
     connected: bool = False
     latency_ms: Optional[int] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UIFlags:
     dark_mode: bool = True
     sidebar_collapsed: bool = False
     inspector_visible: bool = True
 
 
+# =============================================================================
+# NOTIFICATION BATCHING
+# =============================================================================
+
+class AppStateBatcher:
+    """
+    Coalescing batch processor on the asyncio loop.
+
+    Emits scheduled from a running asyncio task during one loop iteration
+    run together in a single call_soon() flush. Keyed entries coalesce, so
+    a burst of updates to one domain produces one emit with the final value.
+
+    Outside an asyncio task (Qt slots, other threads, no running loop)
+    schedule() returns False and the caller emits synchronously.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Hashable, Callable[[], None]] = {}
+        self._handle: Optional[asyncio.Handle] = None
+
+    def schedule(self, fn: Callable[[], None], key: Optional[Hashable] = None) -> bool:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+
+        if asyncio.current_task(loop) is None:
+            return False
+
+        self._entries[object() if key is None else key] = fn
+
+        if self._handle is None:
+            self._handle = loop.call_soon(self._flush)
+        return True
+
+    def _flush(self) -> None:
+        # Work scheduled by the callables below lands in the next flush
+        self._handle = None
+        entries, self._entries = self._entries, {}
+
+        for fn in entries.values():
+            fn()
+
+
 # =============================================================================
 # APPLICATION STATE CONTAINER
 # =============================================================================
@@ -89,12 +144,23 @@ class AppState(QObject):
     backend_changed = pyqtSignal(BackendState)
     ui_flags_changed = pyqtSignal(UIFlags)
 
-    # ---- generic signal (debug / telemetry) ----
+    # ---- generic signal (debug / telemetry, opt-in) ----
     state_changed = pyqtSignal(str, object)
 
     def __init__(self):
         super().__init__()
-        self._mutex = QMutex()
+        # Snapshots are immutable, so readers never lock; writers only
+        # hold this plain lock for the build-and-swap, never across emits.
+        self._lock = threading.Lock()
+
+        # Snapshots swap immediately; signal emits are batched per loop tick
+        self._batcher = AppStateBatcher()
+
+        # state_changed is a debug channel: off unless explicitly enabled
+        self._state_changed_enabled = (
+            os.environ.get(STATE_DEBUG_ENV) == "1"
+            or logger.isEnabledFor(logging.DEBUG)
+        )
 
         # Internal immutable state snapshots
         self._user = UserState()
@@ -142,36 +208,81 @@ class AppState(QObject):
     # =========================================================================
     # STATE UPDATE API (IMMUTABLE, SIGNAL-DRIVEN)
     # =========================================================================
+    # Updates that leave a domain unchanged are dropped without emitting.
+    # Readers see new snapshots at once; signals fire once per loop tick.
 
     def set_user(self, **kwargs) -> None:
-        with QMutexLocker(self._mutex):
-            self._user = UserState(**{**self._user.__dict__, **kwargs})
-        self.user_changed.emit(self._user)
-        self.state_changed.emit("user", self._user)
+        with self._lock:
+            old = self._user
+            new = replace(old, **kwargs)
+            if new == old:
+                return
+            self._user = new
+        self._publish("user", self.user_changed, new)
+
+        # Login / logout / plan change: one bus-wide permissions signal
+        if new.plan != old.plan or new.authenticated != old.authenticated:
+            self._publish_permissions(new)
 
     def set_project(self, **kwargs) -> None:
-        with QMutexLocker(self._mutex):
-            self._project = ProjectState(**{**self._project.__dict__, **kwargs})
-        self.project_changed.emit(self._project)
-        self.state_changed.emit("project", self._project)
+        with self._lock:
+            new = replace(self._project, **kwargs)
+            if new == self._project:
+                return
+            self._project = new
+        self._publish("project", self.project_changed, new)
 
     def set_generation(self, **kwargs) -> None:
-        with QMutexLocker(self._mutex):
-            self._generation = GenerationState(**{**self._generation.__dict__, **kwargs})
-        self.generation_changed.emit(self._generation)
-        self.state_changed.emit("generation", self._generation)
+        with self._lock:
+            new = replace(self._generation, **kwargs)
+            if new == self._generation:
+                return
+            self._generation = new
+        self._publish("generation", self.generation_changed, new)
 
     def set_backend(self, **kwargs) -> None:
-        with QMutexLocker(self._mutex):
-            self._backend = BackendState(**{**self._backend.__dict__, **kwargs})
-        self.backend_changed.emit(self._backend)
-        self.state_changed.emit("backend", self._backend)
+        with self._lock:
+            new = replace(self._backend, **kwargs)
+            if new == self._backend:
+                return
+            self._backend = new
+        self._publish("backend", self.backend_changed, new)
 
     def set_ui_flags(self, **kwargs) -> None:
-        with QMutexLocker(self._mutex):
-            self._ui_flags = UIFlags(**{**self._ui_flags.__dict__, **kwargs})
-        self.ui_flags_changed.emit(self._ui_flags)
-        self.state_changed.emit("ui_flags", self._ui_flags)
+        with self._lock:
+            new = replace(self._ui_flags, **kwargs)
+            if new == self._ui_flags:
+                return
+            self._ui_flags = new
+        self._publish("ui_flags", self.ui_flags_changed, new)
+
+    def enable_state_changed_signal(self, enabled: bool = True) -> None:
+        """
+        Opt in to the generic state_changed signal (debug / telemetry).
+        """
+        self._state_changed_enabled = enabled
+
+    def _publish(self, domain: str, signal, snapshot: Any) -> None:
+        """
+        Emit the granular + generic signals for a domain, batched when
+        called from an asyncio task.
+        """
+        def emit() -> None:
+            signal.emit(snapshot)
+            if self._state_changed_enabled:
+                self.state_changed.emit(domain, snapshot)
+
+        if not self._batcher.schedule(emit, key=domain):
+            emit()
+
+    def _publish_permissions(self, user: UserState) -> None:
+        payload = {"plan": user.plan, "authenticated": user.authenticated}
+
+        def emit() -> None:
+            get_signals().permissions_changed.emit(payload)
+
+        if not self._batcher.schedule(emit, key="permissions"):
+            emit()
 
     def set_mode(self, mode: str) -> None:
         self.set_project(mode=mode)
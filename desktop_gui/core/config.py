@@ -20,8 +20,8 @@ It is a declarative control plane for the GUI.
 
 from __future__ import annotations
 
-from typing import Dict, Set, Any
-from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Any, Tuple
+from dataclasses import dataclass, fields
 
 
 # =============================================================================
@@ -85,8 +85,30 @@ class PageConfig:
     - which pages are preloaded
     """
 
-    enabled_pages: Set[str] = field(default_factory=set)
-    preload_pages: Set[str] = field(default_factory=set)
+    enabled_pages: FrozenSet[str] = frozenset()
+    preload_pages: FrozenSet[str] = frozenset()
+
+
+# =============================================================================
+# TRANSPORT TUNING
+# =============================================================================
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """
+    Backend transport tuning (gRPC channel arguments).
+
+    Trade-off: larger messages / buffers raise streaming throughput
+    for big preview chunks, at the cost of more memory buffered per
+    stream. HTTP/2 flow-control windows are auto-sized by BDP probing.
+    """
+
+    grpc_keepalive_time_ms: int = 20_000
+    grpc_keepalive_timeout_ms: int = 10_000
+    grpc_min_ping_interval_ms: int = 10_000
+    grpc_max_message_bytes: int = 16 * 1024 * 1024
+    grpc_write_buffer_bytes: int = 1024 * 1024
+    grpc_bdp_probe: bool = True
 
 
 # =============================================================================
@@ -108,8 +130,11 @@ class UIConfig:
     def __init__(self, mode: str = UI_MODE_SIMPLE):
         self._mode = mode
 
-        self._flags = self._resolve_feature_flags(mode)
-        self._pages = self._resolve_pages(mode)
+        self._flags = _FLAGS_BY_MODE.get(mode, _DEFAULT_FLAGS)
+        self._flag_table = _FLAG_TABLES_BY_MODE.get(mode, _DEFAULT_FLAG_TABLE)
+        self._pages = _PAGES_BY_MODE.get(mode, _DEFAULT_PAGES)
+        self._enabled_pages = self._pages.enabled_pages
+        self._transport = _TRANSPORT_BY_MODE.get(mode, _DEFAULT_TRANSPORT)
 
     # ------------------------------------------------------------------
     # MODE
@@ -128,134 +153,160 @@ class UIConfig:
         return self._flags
 
     def is_feature_enabled(self, name: str) -> bool:
-        return bool(getattr(self._flags, name, False))
+        return self._flag_table.get(name, False)
 
     # ------------------------------------------------------------------
     # PAGES
     # ------------------------------------------------------------------
 
     @property
-    def enabled_pages(self) -> Set[str]:
-        return self._pages.enabled_pages
+    def enabled_pages(self) -> FrozenSet[str]:
+        return self._enabled_pages
 
     @property
-    def preload_pages(self) -> Set[str]:
+    def preload_pages(self) -> FrozenSet[str]:
         return self._pages.preload_pages
 
     def is_page_enabled(self, page_name: str) -> bool:
-        return page_name in self._pages.enabled_pages
+        # Already a frozenset hash probe; an lru_cache wrapper would only
+        # add its own key hashing on top.
+        return page_name in self._enabled_pages
 
     # ------------------------------------------------------------------
-    # INTERNAL RESOLUTION
+    # TRANSPORT
     # ------------------------------------------------------------------
 
-    def _resolve_feature_flags(self, mode: str) -> FeatureFlags:
-        """
-        Resolve feature flags based on UI mode.
-        """
-        if mode == UI_MODE_SIMPLE:
-            return FeatureFlags(
-                studio=False,
-                chat_assistant=False,
-                advanced_voice_controls=False,
-                advanced_visual_controls=False,
-                multi_reference_input=False,
-                seed_control=False,
-                live_preview=False,
-                analytics_panel=False,
-                admin_pages=False,
-            )
-
-        if mode == UI_MODE_PRO:
-            return FeatureFlags(
-                studio=True,
-                chat_assistant=True,
-                advanced_voice_controls=True,
-                advanced_visual_controls=True,
-                multi_reference_input=True,
-                seed_control=True,
-                live_preview=True,
-                analytics_panel=False,
-                admin_pages=False,
-            )
-
-        if mode == UI_MODE_ENTERPRISE:
-            return FeatureFlags(
-                studio=True,
-                chat_assistant=True,
-                advanced_voice_controls=True,
-                advanced_visual_controls=True,
-                multi_reference_input=True,
-                seed_control=True,
-                live_preview=True,
-                analytics_panel=True,
-                admin_pages=True,
-                billing_ui=True,
-            )
-
-        # Fallback safety
-        return FeatureFlags()
-
-    def _resolve_pages(self, mode: str) -> PageConfig:
+    @property
+    def transport(self) -> TransportConfig:
+        return self._transport
+
+    def grpc_channel_options(self) -> List[Tuple[str, int]]:
         """
-        Resolve page availability & preload strategy.
+        Channel arguments for grpc.aio channels.
         """
-        if mode == UI_MODE_SIMPLE:
-            return PageConfig(
-                enabled_pages={
-                    "home",
-                    "create",
-                    "library",
-                    "subscription",
-                    "help",
-                },
-                preload_pages={
-                    "home",
-                    "create",
-                },
-            )
-
-        if mode == UI_MODE_PRO:
-            return PageConfig(
-                enabled_pages={
-                    "home",
-                    "create",
-                    "studio",
-                    "library",
-                    "chat",
-                    "notifications",
-                    "subscription",
-                    "learning",
-                    "help",
-                },
-                preload_pages={
-                    "home",
-                    "create",
-                    "library",
-                },
-            )
-
-        if mode == UI_MODE_ENTERPRISE:
-            return PageConfig(
-                enabled_pages={
-                    "home",
-                    "create",
-                    "studio",
-                    "library",
-                    "chat",
-                    "notifications",
-                    "subscription",
-                    "learning",
-                    "admin",
-                    "jobs",
-                    "help",
-                },
-                preload_pages={
-                    "home",
-                    "create",
-                    "studio",
-                    "library",
-                },
-            )
-
-        return PageConfig()
+        t = self._transport
+        return [
+            ("grpc.keepalive_time_ms", t.grpc_keepalive_time_ms),
+            ("grpc.keepalive_timeout_ms", t.grpc_keepalive_timeout_ms),
+            ("grpc.http2.min_time_between_pings_ms", t.grpc_min_ping_interval_ms),
+            ("grpc.http2.max_pings_without_data", 0),
+            ("grpc.max_receive_message_length", t.grpc_max_message_bytes),
+            ("grpc.max_send_message_length", t.grpc_max_message_bytes),
+            ("grpc.http2.write_buffer_size", t.grpc_write_buffer_bytes),
+            ("grpc.http2.bdp_probe", int(t.grpc_bdp_probe)),
+        ]
+
+
+
+# =============================================================================
+# PRECOMPUTED MODE TABLES
+# =============================================================================
+# Resolved once at import; UIConfig() is two dict lookups per mode.
+
+_DEFAULT_FLAGS = FeatureFlags()
+_DEFAULT_PAGES = PageConfig()
+_DEFAULT_TRANSPORT = TransportConfig()
+
+_FLAGS_BY_MODE: Dict[str, FeatureFlags] = {
+    UI_MODE_SIMPLE: FeatureFlags(
+        studio=False,
+        chat_assistant=False,
+        advanced_voice_controls=False,
+        advanced_visual_controls=False,
+        multi_reference_input=False,
+        seed_control=False,
+        live_preview=False,
+        analytics_panel=False,
+        admin_pages=False,
+    ),
+    UI_MODE_PRO: FeatureFlags(
+        studio=True,
+        chat_assistant=True,
+        advanced_voice_controls=True,
+        advanced_visual_controls=True,
+        multi_reference_input=True,
+        seed_control=True,
+        live_preview=True,
+        analytics_panel=False,
+        admin_pages=False,
+    ),
+    UI_MODE_ENTERPRISE: FeatureFlags(
+        studio=True,
+        chat_assistant=True,
+        advanced_voice_controls=True,
+        advanced_visual_controls=True,
+        multi_reference_input=True,
+        seed_control=True,
+        live_preview=True,
+        analytics_panel=True,
+        admin_pages=True,
+        billing_ui=True,
+    ),
+}
+
+def _flag_table(flags: FeatureFlags) -> Dict[str, bool]:
+    """
+    Flatten a FeatureFlags snapshot into a name → bool lookup table.
+    """
+    return {f.name: bool(getattr(flags, f.name)) for f in fields(flags)}
+
+
+# is_feature_enabled() is a plain dict lookup instead of getattr()
+_DEFAULT_FLAG_TABLE = _flag_table(_DEFAULT_FLAGS)
+_FLAG_TABLES_BY_MODE: Dict[str, Dict[str, bool]] = {
+    mode: _flag_table(flags) for mode, flags in _FLAGS_BY_MODE.items()
+}
+
+# Page sets are shared, immutable module constants
+_ENABLED_SIMPLE: FrozenSet[str] = frozenset({
+    "home",
+    "create",
+    "library",
+    "subscription",
+    "help",
+})
+_PRELOAD_SIMPLE: FrozenSet[str] = frozenset({
+    "home",
+    "create",
+})
+
+_ENABLED_PRO: FrozenSet[str] = _ENABLED_SIMPLE | {
+    "studio",
+    "chat",
+    "notifications",
+    "learning",
+}
+_PRELOAD_PRO: FrozenSet[str] = _PRELOAD_SIMPLE | {
+    "library",
+}
+
+_ENABLED_ENTERPRISE: FrozenSet[str] = _ENABLED_PRO | {
+    "admin",
+    "jobs",
+}
+_PRELOAD_ENTERPRISE: FrozenSet[str] = _PRELOAD_PRO | {
+    "studio",
+}
+
+_PAGES_BY_MODE: Dict[str, PageConfig] = {
+    UI_MODE_SIMPLE: PageConfig(
+        enabled_pages=_ENABLED_SIMPLE,
+        preload_pages=_PRELOAD_SIMPLE,
+    ),
+    UI_MODE_PRO: PageConfig(
+        enabled_pages=_ENABLED_PRO,
+        preload_pages=_PRELOAD_PRO,
+    ),
+    UI_MODE_ENTERPRISE: PageConfig(
+        enabled_pages=_ENABLED_ENTERPRISE,
+        preload_pages=_PRELOAD_ENTERPRISE,
+    ),
+}
+
+# Enterprise gets larger gRPC buffers
+_TRANSPORT_BY_MODE: Dict[str, TransportConfig] = {
+    UI_MODE_ENTERPRISE: TransportConfig(
+        grpc_max_message_bytes=64 * 1024 * 1024,
+        grpc_write_buffer_bytes=4 * 1024 * 1024,
+    ),
+}
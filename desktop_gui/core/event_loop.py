@@ -0,0 +1,231 @@
+"""
+NOSIS Desktop GUI – Qt-driven asyncio Event Loop
+===============================================
+
+Lightweight asyncio ↔ Qt bridge for PyQt6 (2026).
+
+Purpose:
+- Run asyncio callbacks from Qt's own event dispatcher (app.exec())
+- Wake at the next real asyncio deadline instead of a fixed-rate tick
+- Drop-in alternative to qasync.QEventLoop (same run_forever / with-block usage)
+
+PyQt6 has no equivalent of PySide6.QtAsyncio, so this module vendors
+the same idea: Qt owns the blocking wait, asyncio only runs one
+non-blocking iteration whenever something is due.
+
+This module contains:
+- NO UI code
+- NO business logic
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import os
+import selectors
+import sys
+import threading
+from typing import Optional
+
+from PyQt6.QtCore import QCoreApplication, QSocketNotifier, QTimer
+
+logger = logging.getLogger("nosis.event_loop")
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+IDLE_POLL_MS = 50  # fd polling fallback when the selector has no pollable fd
+
+# asyncio <-> Qt bridge: "qasync" (default) or "native" (QtDrivenEventLoop)
+ASYNC_BRIDGE_ENV = "NOSIS_ASYNC_BRIDGE"
+
+
+# =============================================================================
+# SELECTOR
+# =============================================================================
+
+class _NonBlockingSelector(selectors.DefaultSelector):
+    """
+    Selector that never blocks.
+
+    Qt's event dispatcher owns the wait; asyncio only collects
+    whatever I/O is already ready.
+    """
+
+    def select(self, timeout: Optional[float] = None):
+        return super().select(0)
+
+
+# =============================================================================
+# EVENT LOOP
+# =============================================================================
+
+class QtDrivenEventLoop(asyncio.SelectorEventLoop):
+    """
+    asyncio event loop driven by Qt events.
+
+    Two wake-up sources, no polling:
+    - QSocketNotifier on the selector's own fd (epoll / kqueue),
+      which becomes readable whenever any registered socket
+      (including the self-pipe used by call_soon_threadsafe) is ready
+    - a single-shot QTimer armed for the earliest asyncio deadline
+      (0 ms if callbacks are already ready)
+
+    Selectors without a pollable fd (SelectSelector on Windows) fall
+    back to re-checking I/O every IDLE_POLL_MS.
+
+    Work scheduled from outside an iteration (Qt slots calling
+    call_soon / create_task / call_later) re-arms the timer, so it
+    runs without waiting for an unrelated I/O wake-up.
+    """
+
+    def __init__(self, app: QCoreApplication):
+        super().__init__(_NonBlockingSelector())
+        self._app = app
+
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._step)
+
+        self._notifier: Optional[QSocketNotifier] = None
+        try:
+            selector_fd = self._selector.fileno()
+        except AttributeError:
+            logger.info("Selector has no fd; falling back to %d ms I/O polling", IDLE_POLL_MS)
+        else:
+            self._notifier = QSocketNotifier(selector_fd, QSocketNotifier.Type.Read)
+            self._notifier.setEnabled(False)
+            self._notifier.activated.connect(self._step)
+
+        self._old_agen_hooks = None
+        self._stepping = False
+
+    # ------------------------------------------------------------------
+    # LIFECYCLE
+    # ------------------------------------------------------------------
+
+    def run_forever(self) -> int:
+        """
+        Run Qt's native event loop with asyncio attached.
+
+        Returns the QApplication exit code (like qasync.QEventLoop).
+        """
+        self._check_closed()
+        if self.is_running():
+            raise RuntimeError("This event loop is already running")
+
+        self._thread_id = threading.get_ident()
+        self._old_agen_hooks = sys.get_asyncgen_hooks()
+        sys.set_asyncgen_hooks(
+            firstiter=self._asyncgen_firstiter_hook,
+            finalizer=self._asyncgen_finalizer_hook,
+        )
+        asyncio.events._set_running_loop(self)
+
+        try:
+            if self._notifier is not None:
+                self._notifier.setEnabled(True)
+            self._schedule_next()
+            return self._app.exec()
+        finally:
+            self._timer.stop()
+            if self._notifier is not None:
+                self._notifier.setEnabled(False)
+            self._stopping = False
+            self._thread_id = None
+            asyncio.events._set_running_loop(None)
+            sys.set_asyncgen_hooks(*self._old_agen_hooks)
+
+    def stop(self) -> None:
+        super().stop()
+        self._app.quit()
+
+    def __enter__(self) -> "QtDrivenEventLoop":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._notifier is not None:
+            self._notifier.setEnabled(False)
+            self._notifier = None
+        super().close()
+
+    # ------------------------------------------------------------------
+    # SCHEDULING
+    # ------------------------------------------------------------------
+
+    def call_soon(self, callback, *args, context=None):
+        handle = super().call_soon(callback, *args, context=context)
+        self._wake()
+        return handle
+
+    def call_at(self, when, callback, *args, context=None):
+        # call_later() delegates here
+        handle = super().call_at(when, callback, *args, context=context)
+        self._wake()
+        return handle
+
+    def _wake(self) -> None:
+        """
+        Re-arm the timer for work added outside _step().
+
+        Inside _step() the trailing _schedule_next() already covers it.
+        """
+        if not self.is_running() or self._stepping:
+            return
+        self._schedule_next()
+
+    def _step(self, *_) -> None:
+        """
+        Run exactly one non-blocking asyncio iteration.
+        """
+        self._stepping = True
+        try:
+            self._run_once()
+        finally:
+            self._stepping = False
+        self._schedule_next()
+
+    def _schedule_next(self) -> None:
+        # I/O readiness is delivered by the notifier; the timer only
+        # covers ready callbacks and asyncio deadlines.
+        poll_cap = IDLE_POLL_MS if self._notifier is None else None
+
+        if self._ready:
+            delay_ms = 0
+        elif self._scheduled:
+            delay = self._scheduled[0]._when - self.time()
+            delay_ms = max(0, math.ceil(delay * 1000))
+            if poll_cap is not None:
+                delay_ms = min(delay_ms, poll_cap)
+        elif poll_cap is not None:
+            delay_ms = poll_cap
+        else:
+            self._timer.stop()
+            return
+
+        self._timer.start(delay_ms)
+
+
+# =============================================================================
+# FACTORY
+# =============================================================================
+
+def create_qt_event_loop(app: QCoreApplication) -> asyncio.AbstractEventLoop:
+    """
+    Build the asyncio loop bridged to app, as selected by NOSIS_ASYNC_BRIDGE:
+    - "qasync" (default): qasync.QEventLoop
+    - "native": QtDrivenEventLoop, stepped by Qt at the next asyncio
+      deadline instead of qasync's timer proxying
+    """
+    if os.environ.get(ASYNC_BRIDGE_ENV, "qasync") == "native":
+        return QtDrivenEventLoop(app)
+
+    import qasync  # deferred: only needed for this bridge
+
+    return qasync.QEventLoop(app)
@@ -20,8 +20,9 @@ It is a *frontend control plane* that mirrors backend rules.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Optional
+import sys
+from dataclasses import dataclass, fields
+from typing import Dict, FrozenSet, Optional
 
 from desktop_gui.core.app_state import get_app_state
 
@@ -114,6 +115,76 @@ PLAN_REGISTRY: Dict[str, PlanLimits] = {
 }
 
 
+# =============================================================================
+# ROUTE ACCESS TABLES
+# =============================================================================
+
+# Interned so route names arriving at runtime (signals, QString
+# conversions) compare by identity after sys.intern() at entry points.
+ALL_ROUTES = tuple(sys.intern(route) for route in (
+    "home",
+    "create",
+    "studio",
+    "chat",
+    "library",
+    "subscription",
+    "notifications",
+    "learning",
+    "help",
+    "jobs",
+    "admin",
+))
+
+_STUDIO = sys.intern("studio")
+_ADMIN = sys.intern("admin")
+
+
+def _compute_access(plan: str, route: str) -> bool:
+    """
+    Page access rule (evaluated once per plan/route at import).
+    """
+    if route == _STUDIO:
+        return PLAN_REGISTRY[plan].studio_access
+
+    if route == _ADMIN:
+        return plan == PLAN_ENTERPRISE
+
+    return True
+
+
+def _build_denied_routes() -> Dict[str, FrozenSet[str]]:
+    """
+    Precompute denied routes per plan.
+
+    Stored as the *denied* set so routes outside ALL_ROUTES keep
+    defaulting to allowed with a single membership test.
+    """
+    return {
+        plan: frozenset(r for r in ALL_ROUTES if not _compute_access(plan, r))
+        for plan in PLAN_REGISTRY
+    }
+
+
+_DENIED_ROUTES_BY_PLAN = _build_denied_routes()
+
+
+# =============================================================================
+# FEATURE TABLES
+# =============================================================================
+
+def _build_feature_maps() -> Dict[str, Dict[str, bool]]:
+    """
+    Flatten each plan's limits into a name → bool map for can_use_feature.
+    """
+    return {
+        plan: {f.name: bool(getattr(limits, f.name)) for f in fields(limits)}
+        for plan, limits in PLAN_REGISTRY.items()
+    }
+
+
+_FEATURES_BY_PLAN = _build_feature_maps()
+
+
 # =============================================================================
 # PERMISSION MANAGER
 # =============================================================================
@@ -130,9 +201,15 @@ class PermissionManager:
     Widgets ask questions, PermissionManager answers them.
     """
 
+    __slots__ = ("_state", "_cached_plan", "_cached_limits")
+
     def __init__(self):
         self._state = get_app_state()
 
+        # Resolved limits for the last seen plan (see `limits`)
+        self._cached_plan: Optional[str] = None
+        self._cached_limits: Optional[PlanLimits] = None
+
     # ------------------------------------------------------------------
     # USER / PLAN
     # ------------------------------------------------------------------
@@ -143,7 +220,12 @@ class PermissionManager:
 
     @property
     def limits(self) -> PlanLimits:
-        return PLAN_REGISTRY.get(self.current_plan, PLAN_REGISTRY[PLAN_FREE])
+        # Keyed by plan, so a plan change invalidates it automatically
+        plan = self._state.user.plan
+        if plan != self._cached_plan:
+            self._cached_limits = PLAN_REGISTRY.get(plan, PLAN_REGISTRY[PLAN_FREE])
+            self._cached_plan = plan
+        return self._cached_limits
 
     # ------------------------------------------------------------------
     # PAGE ACCESS
@@ -153,13 +235,11 @@ class PermissionManager:
         """
         Check whether current user can access a given page.
         """
-        if page_name == "studio":
-            return self.limits.studio_access
-
-        if page_name == "admin":
-            return self.current_plan == PLAN_ENTERPRISE
-
-        return True
+        denied = _DENIED_ROUTES_BY_PLAN.get(
+            self._state.user.plan,
+            _DENIED_ROUTES_BY_PLAN[PLAN_FREE],
+        )
+        return page_name not in denied
 
     def is_route_allowed(self, route: str) -> bool:
         return self.can_access_page(route)
@@ -172,16 +252,18 @@ class PermissionManager:
         """
         Generic feature permission check.
         """
-        return bool(getattr(self.limits, feature_name, False))
-
-    def can_generate(self) -> bool:
-        return self.has_credits()
+        features = _FEATURES_BY_PLAN.get(
+            self._state.user.plan,
+            _FEATURES_BY_PLAN[PLAN_FREE],
+        )
+        return features.get(feature_name, False)
 
     def can_save_project(self) -> bool:
         return self._state.user.authenticated
 
     def inspector_enabled(self) -> bool:
         return self._state.ui_flags.inspector_visible
+
     # ------------------------------------------------------------------
     # GENERATION LIMITS
     # ------------------------------------------------------------------
@@ -196,6 +278,9 @@ class PermissionManager:
         # Backend is authoritative; UI only mirrors
         return self._state.user.authenticated and required <= self.limits.monthly_credits
 
+    # Alias, not a wrapper: can_generate() calls has_credits() directly
+    can_generate = has_credits
+
     # ------------------------------------------------------------------
     # LIBRARY LIMITS
     # ------------------------------------------------------------------
@@ -210,15 +295,13 @@ class PermissionManager:
     def can_export_stems(self) -> bool:
         return self.limits.export_stems
 
-     def is_commercial_use_allowed(self) -> bool:
+    def is_commercial_use_allowed(self) -> bool:
         return self.limits.commercial_use
 
 
-_permissions: Optional[PermissionManager] = None
+# Created eagerly at import: the accessor is a plain global read
+_permissions = PermissionManager()
 
 def get_permissions() -> PermissionManager:
-    global _permissions
-    if _permissions is None:
-        _permissions = PermissionManager()
     return _permissions
 
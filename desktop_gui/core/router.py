@@ -1,12 +1,17 @@
 # desktop_gui/core/router.py
 
-from typing import Dict, Type, Optional, List
+import sys
+from collections import deque
+from typing import Deque, Dict, Type, Optional, List
 from PyQt6.QtWidgets import QStackedWidget, QWidget
 from PyQt6.QtCore import QObject, pyqtSignal
 
-from desktop_gui.core.permissions import PermissionManager
+from desktop_gui.core.permissions import get_permissions
 from desktop_gui.core.config import UIConfig
 
+# Navigation history is bounded so long sessions don't grow it forever
+HISTORY_MAX_LENGTH = 64
+
 
 class Router(QObject):
     """
@@ -25,12 +30,17 @@ class Router(QObject):
         super().__init__(parent)
 
         self._stack = QStackedWidget(parent)
-        self._pages: Dict[str, QWidget] = {}
-        self._page_classes: Dict[str, Type[QWidget]] = {}
-        self._history: List[str] = []
-
-        self._permissions = PermissionManager()
+        # Page table as parallel lists indexed by registration order
+        self._names: Dict[str, int] = {}            # name -> slot
+        self._classes: List[Type[QWidget]] = []
+        self._widgets: List[Optional[QWidget]] = []
+        self._stack_index: List[int] = []           # slot -> QStackedWidget index (-1 = not built)
+        self._history: Deque[str] = deque(maxlen=HISTORY_MAX_LENGTH)
+
+        self._permissions = get_permissions()
         self._config = UIConfig()
+        # UIConfig is immutable per mode, so the set never needs invalidating
+        self._enabled_pages = self._config.enabled_pages
 
     # ---------- PUBLIC API ----------
 
@@ -46,29 +56,38 @@ class Router(QObject):
         Example:
             router.register_page("create", CreatePage)
         """
-        if name in self._page_classes:
+        name = sys.intern(name)
+        if name in self._names:
             raise ValueError(f"Page '{name}' already registered")
 
-        self._page_classes[name] = widget_cls
+        self._names[name] = len(self._classes)
+        self._classes.append(widget_cls)
+        self._widgets.append(None)
+        self._stack_index.append(-1)
 
     def preload_pages(self) -> None:
         """
         Preload pages marked as preloadable in UIConfig.
         """
-        for name in self._config.preload_pages:
-            if name in self._page_classes:
-                self._ensure_page(name)
+        # frozenset & dict keys view: C-level intersection
+        for name in self._config.preload_pages & self._names.keys():
+            self._ensure_page(name)
 
     def navigate(self, name: str) -> None:
         """
         Navigate to page by name.
         """
+        # Names from signals are fresh str objects; intern once so history
+        # and page-table compares hit the identity fast path.
+        name = sys.intern(name)
+
         if not self.can_access(name):
             raise PermissionError(f"Access denied for page '{name}'")
 
-        widget = self._ensure_page(name)
+        slot = self._ensure_slot(name)
 
-        self._stack.setCurrentWidget(widget)
+        # setCurrentIndex avoids QStackedWidget's indexOf() scan
+        self._stack.setCurrentIndex(self._stack_index[slot])
         self._history.append(name)
 
         self.page_changed.emit(name)
@@ -82,42 +101,53 @@ class Router(QObject):
 
         self._history.pop()
         previous = self._history[-1]
-        self._stack.setCurrentWidget(self._pages[previous])
+        self._stack.setCurrentIndex(self._stack_index[self._names[previous]])
         self.page_changed.emit(previous)
 
     # ---------- INTERNAL ----------
 
-    def _ensure_page(self, name: str) -> QWidget:
+    def _ensure_slot(self, name: str) -> int:
         """
-        Lazily create page if not exists.
+        Lazily create page if not exists; returns its page-table slot.
         """
-        if name in self._pages:
-            return self._pages[name]
-
-        if name not in self._page_classes:
+        slot = self._names.get(name)
+        if slot is None:
             raise KeyError(f"Page '{name}' is not registered")
 
-        page = self._page_classes[name]()
-        self._pages[name] = page
-        self._stack.addWidget(page)
+        if self._widgets[slot] is None:
+            page = self._classes[slot]()
+            self._widgets[slot] = page
+            self._stack_index[slot] = self._stack.addWidget(page)
 
-        return page
+        return slot
+
+    def _ensure_page(self, name: str) -> QWidget:
+        """
+        Lazily create page if not exists.
+        """
+        return self._widgets[self._ensure_slot(name)]
 
     def can_access(self, name: str) -> bool:
         """
         Permission + feature flag check.
         """
-        if not self._config.is_page_enabled(name):
+        if name not in self._enabled_pages:
             return False
 
         return self._permissions.can_access_page(name)
 
-   def clear(self) -> None:
+    def clear(self) -> None:
         """
         Destroy all pages (used for logout / user switch).
         """
-        self._stack.clear()
-        self._pages.clear()
+        # QStackedWidget has no clear(); detach and delete built pages.
+        # Registrations are kept so pages rebuild lazily on next visit.
+        for slot, page in enumerate(self._widgets):
+            if page is not None:
+                self._stack.removeWidget(page)
+                page.deleteLater()
+                self._widgets[slot] = None
+                self._stack_index[slot] = -1
         self._history.clear()
 
 
@@ -125,6 +155,8 @@ _router: Optional[Router] = None
 
 
 def get_router(parent: Optional[QWidget] = None) -> Router:
+    # Stays lazy: the router owns a QStackedWidget, which needs a
+    # QApplication and the caller's parent widget.
     global _router
     if _router is None:
         _router = Router(parent)
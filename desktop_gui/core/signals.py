@@ -18,10 +18,26 @@ Philosophy:
 
 from __future__ import annotations
 
-from typing import Optional, Any, Dict
+from typing import NamedTuple, Optional, Any, Dict
 from PyQt6.QtCore import QObject, pyqtSignal
 
 
+# =============================================================================
+# TYPED PAYLOADS
+# =============================================================================
+
+class GenerationPreview(NamedTuple):
+    """
+    Streamed / partial generation output.
+
+    Carried by generation_preview as a plain object, so PyQt passes
+    a reference instead of converting a dict on every emit.
+    """
+    chunk_id: Optional[int]
+    audio_chunk: Any            # bytes | memoryview
+    sample_rate: Optional[int] = None
+
+
 class UISignals(QObject):
     """
     Central UI Event Bus.
@@ -72,10 +88,10 @@ class UISignals(QObject):
     # ------------------------------------------------------------------
     # GENERATION PIPELINE
     # ------------------------------------------------------------------
-     generation_requested = pyqtSignal(dict)     # full generation payload
+    generation_requested = pyqtSignal(dict)     # full generation payload
     generation_started = pyqtSignal()
     generation_progress = pyqtSignal(float)     # 0.0 .. 1.0
-    generation_preview = pyqtSignal(dict)       # streamed / partial output
+    generation_preview = pyqtSignal(object)     # GenerationPreview
     generation_finished = pyqtSignal(dict)      # final result metadata
     generation_failed = pyqtSignal(str)
     generation_cancelled = pyqtSignal()
@@ -120,7 +136,7 @@ class UISignals(QObject):
     # ------------------------------------------------------------------
     # USER / AUTH / BILLING
     # ------------------------------------------------------------------
-    user_logged_in = pyqtSignal(dict)
+    user_logged_in = pyqtSignal(str)            # user_id (details in AppState)
     user_logged_out = pyqtSignal()
     subscription_changed = pyqtSignal(str)
     permissions_updated = pyqtSignal(dict)
@@ -145,7 +161,8 @@ class UISignals(QObject):
 # GLOBAL SINGLETON ACCESSOR
 # ----------------------------------------------------------------------
 
-_signals: Optional[UISignals] = None
+# Created eagerly at import: the accessor is a plain global read
+_signals = UISignals()
 
 
 def get_signals() -> UISignals:
@@ -157,8 +174,5 @@ def get_signals() -> UISignals:
     - predictable signal routing
     - easy mocking for tests
     """
-    global _signals
-    if _signals is None:
-        _signals = UISignals()
     return _signals
 
@@ -34,9 +34,9 @@ from PyQt6.QtWidgets import (
 )
 
 from desktop_gui.core.router import get_router
-from desktop_gui.core.signals import get_signals
+from desktop_gui.core.signals import UISignals, get_signals
 from desktop_gui.core.app_state import get_app_state
-from desktop_gui.core.permissions import get_permissions
+from desktop_gui.core.permissions import PermissionManager, get_permissions
 
 logger = logging.getLogger("nosis.main_window")
 
@@ -122,10 +122,12 @@ class MainWindow(QMainWindow):
         """
         Bind application-wide signals.
         """
-        self._signals.route_changed.connect(self._on_route_changed)
-        self._signals.user_logged_in.connect(self._on_user_changed)
-        self._signals.user_logged_out.connect(self._on_user_changed)
-        self._signals.selection_changed.connect(self.inspector.update_content)
+        # Emitted on the GUI thread only: skip AutoConnection's thread check
+        direct = Qt.ConnectionType.DirectConnection
+
+        # Panels subscribe to permissions_changed themselves
+        self._signals.route_changed.connect(self._on_route_changed, direct)
+        self._signals.selection_changed.connect(self.inspector.update_content, direct)
 
     # ------------------------------------------------------------------
     # HANDLERS
@@ -135,13 +137,6 @@ class MainWindow(QMainWindow):
         logger.debug("Route changed: %s", route)
         self.workspace.set_page(route)
 
-    def _on_user_changed(self, *_):
-        """
-        Update UI when user / plan changes.
-        """
-        self.sidebar.refresh_permissions()
-        self.inspector.refresh_permissions()
-
 
 # =============================================================================
 # SIDEBAR
@@ -161,6 +156,9 @@ class Sidebar(QFrame):
         self.setFrameShape(QFrame.Shape.NoFrame)
 
         self._init_ui()
+        self._signals.permissions_changed.connect(
+            self.refresh_permissions, Qt.ConnectionType.DirectConnection
+        )
 
     def _init_ui(self) -> None:
         layout = QVBoxLayout(self)
@@ -173,6 +171,9 @@ class Sidebar(QFrame):
 
         layout.addSpacing(24)
 
+        # Items share the sidebar's bus / permission references
+        sig, perm = self._signals, self._permissions
+
         self.nav_items = []
         for route in [
             "home",
@@ -183,18 +184,18 @@ class Sidebar(QFrame):
             "subscription",
             "notifications",
         ]:
-            item = SidebarItem(route)
+            item = SidebarItem(route, sig, perm)
             self.nav_items.append(item)
             layout.addWidget(item)
 
         layout.addStretch()
 
         for route in ["learning", "help", "jobs"]:
-            item = SidebarItem(route, secondary=True)
+            item = SidebarItem(route, sig, perm, secondary=True)
             self.nav_items.append(item)
             layout.addWidget(item)
 
-    def refresh_permissions(self) -> None:
+    def refresh_permissions(self, *_) -> None:
         """
         Enable / disable items based on user plan.
         """
@@ -207,13 +208,19 @@ class SidebarItem(QLabel):
     Single clickable navigation item.
     """
 
-    def __init__(self, route: str, secondary: bool = False):
+    def __init__(
+        self,
+        route: str,
+        signals: UISignals,
+        permissions: PermissionManager,
+        secondary: bool = False,
+    ):
         super().__init__(route.capitalize())
 
         self.route = route
         self.secondary = secondary
-        self._signals = get_signals()
-        self._permissions = get_permissions()
+        self._signals = signals
+        self._permissions = permissions
 
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
@@ -242,9 +249,12 @@ class Workspace(QFrame):
 
         self.setFrameShape(QFrame.Shape.NoFrame)
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(router.widget)
+        # Single child: no layout object, the stack just fills the frame
+        router.widget.setParent(self)
+
+    def resizeEvent(self, event) -> None:
+        self._router.widget.setGeometry(self.rect())
+        super().resizeEvent(event)
 
     def set_page(self, route: str) -> None:
         self._router.navigate(route)
@@ -267,6 +277,9 @@ class Inspector(QFrame):
         self.setFrameShape(QFrame.Shape.NoFrame)
 
         self._init_ui()
+        get_signals().permissions_changed.connect(
+            self.refresh_permissions, Qt.ConnectionType.DirectConnection
+        )
 
     def _init_ui(self) -> None:
         layout = QVBoxLayout(self)
@@ -292,5 +305,5 @@ class Inspector(QFrame):
 
         self.content.setText(str(data))
 
-    def refresh_permissions(self) -> None:
+    def refresh_permissions(self, *_) -> None:
         self.setVisible(self._permissions.inspector_enabled())
@@ -18,9 +18,12 @@ NO backend calls
 from __future__ import annotations
 
 import logging
-from typing import List
+import sys
+from array import array
+from typing import List, Optional, Sequence, Tuple
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import QEvent, QRect, QSize, Qt, QTimer
+from PyQt6.QtGui import QPainter, QPalette
 from PyQt6.QtWidgets import (
     QFrame,
     QVBoxLayout,
@@ -29,12 +32,32 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from desktop_gui.core.signals import get_signals
-from desktop_gui.core.permissions import get_permissions
+from desktop_gui.core.signals import UISignals, get_signals
+from desktop_gui.core.permissions import PermissionManager, get_permissions
 from desktop_gui.core.app_state import get_app_state
 
 logger = logging.getLogger("nosis.sidebar")
 
+# (route, label) — order is display order
+PRIMARY_ROUTES: Tuple[Tuple[str, str], ...] = (
+    ("home", "Home"),
+    ("create", "Create"),
+    ("studio", "Studio"),
+    ("chat", "Chat Assistant"),
+    ("library", "Library"),
+    ("subscription", "Subscription"),
+    ("notifications", "Notifications"),
+)
+
+SECONDARY_ROUTES: Tuple[Tuple[str, str], ...] = (
+    ("learning", "Learning"),
+    ("help", "Help"),
+    ("jobs", "Jobs"),
+)
+
+ROW_PADDING_Y = 6   # px above / below each label
+ROW_PADDING_X = 10  # px left of each label
+
 
 # =============================================================================
 # SIDEBAR
@@ -61,7 +84,13 @@ class Sidebar(QFrame):
         self.setObjectName("Sidebar")
         self.setFrameShape(QFrame.Shape.NoFrame)
 
-        self._items: List[SidebarItem] = []
+        self._active_route: Optional[str] = None
+
+        # Coalesces bursts of permissions_changed into one pass
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_refresh)
 
         self._init_ui()
         self._connect_signals()
@@ -85,135 +114,198 @@ class Sidebar(QFrame):
 
         layout.addSpacing(24)
 
+        # Lists share the sidebar's bus / permission references
+        sig, perm = self._signals, self._permissions
+
         # Primary navigation
-        for route in [
-            ("home", "Home"),
-            ("create", "Create"),
-            ("studio", "Studio"),
-            ("chat", "Chat Assistant"),
-            ("library", "Library"),
-            ("subscription", "Subscription"),
-            ("notifications", "Notifications"),
-        ]:
-            self._add_item(layout, route[0], route[1])
+        self._primary = SidebarList(PRIMARY_ROUTES, sig, perm)
+        layout.addWidget(self._primary)
 
         layout.addStretch()
 
         # Secondary navigation
-        for route in [
-            ("learning", "Learning"),
-            ("help", "Help"),
-            ("jobs", "Jobs"),
-        ]:
-            self._add_item(layout, route[0], route[1], secondary=True)
-
-    def _add_item(
-        self,
-        layout: QVBoxLayout,
-        route: str,
-        label: str,
-        secondary: bool = False,
-    ) -> None:
-        item = SidebarItem(
-            route=route,
-            label=label,
-            secondary=secondary,
-        )
-        self._items.append(item)
-        layout.addWidget(item)
+        self._secondary = SidebarList(SECONDARY_ROUTES, sig, perm, secondary=True)
+        layout.addWidget(self._secondary)
+
+        self._do_refresh()
 
     # ------------------------------------------------------------------
     # SIGNALS
     # ------------------------------------------------------------------
 
     def _connect_signals(self) -> None:
-        self._signals.user_logged_in.connect(self.refresh)
-        self._signals.user_logged_out.connect(self.refresh)
-        self._signals.permissions_changed.connect(self.refresh)
-        self._signals.route_changed.connect(self._highlight_active)
+        # Emitted on the GUI thread only: skip AutoConnection's thread check
+        direct = Qt.ConnectionType.DirectConnection
+
+        # AppState emits permissions_changed on login / logout / plan change
+        self._signals.permissions_changed.connect(self.refresh, direct)
+        self._signals.route_changed.connect(self._highlight_active, direct)
 
     # ------------------------------------------------------------------
     # STATE
     # ------------------------------------------------------------------
 
-    def refresh(self) -> None:
+    def refresh(self, *_) -> None:
         """
-        Re-evaluate visibility and enabled state.
+        Schedule a re-evaluation of visibility and enabled state.
+
+        Multiple calls within one event-loop pass coalesce into one.
         """
-        for item in self._items:
-            item.update_permissions()
+        self._refresh_timer.start()
+
+    def _do_refresh(self) -> None:
+        self._primary.refresh()
+        self._secondary.refresh()
 
     def _highlight_active(self, route: str) -> None:
-        for item in self._items:
-            item.set_active(item.route == route)
+        if route == self._active_route:
+            return
+
+        self._active_route = route
+        self._primary.set_active_route(route)
+        self._secondary.set_active_route(route)
 
 
 # =============================================================================
-# SIDEBAR ITEM
+# SIDEBAR LIST
 # =============================================================================
 
-class SidebarItem(QLabel):
+class SidebarList(QWidget):
     """
-    Single navigation entry.
+    Owner-drawn list of navigation entries.
 
     Design:
-    - acts like a button
-    - style-driven (no logic)
+    - one widget per section instead of one QLabel per route
+    - rows stored as parallel arrays (route / label / enabled)
+    - a single paintEvent draws every row from the palette
     """
 
     def __init__(
         self,
-        route: str,
-        label: str,
+        routes: Sequence[Tuple[str, str]],
+        signals: UISignals,
+        permissions: PermissionManager,
         secondary: bool = False,
     ):
-        super().__init__(label)
+        super().__init__()
 
-        self.route = route
-        self.secondary = secondary
+        self._signals = signals
+        self._permissions = permissions
 
-        self._signals = get_signals()
-        self._permissions = get_permissions()
+        self.secondary = secondary
 
-        self._active = False
+        self._routes: List[str] = [route for route, _ in routes]
+        self._labels: List[str] = [label for _, label in routes]
+        self._enabled = array("b", [1] * len(self._routes))
+        self._rows: List[int] = list(range(len(self._routes)))  # drawn indices
+        self._active_idx = -1
+        self._row_h = self._measure_row_height()
 
+        self.setObjectName("SidebarListSecondary" if secondary else "SidebarList")
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
 
-        self._apply_style()
+    # ------------------------------------------------------------------
+    # GEOMETRY
+    # ------------------------------------------------------------------
+
+    def _measure_row_height(self) -> int:
+        return self.fontMetrics().height() + 2 * ROW_PADDING_Y
+
+    def sizeHint(self) -> QSize:
+        return QSize(super().sizeHint().width(), self._row_h * len(self._rows))
+
+    def minimumSizeHint(self) -> QSize:
+        return self.sizeHint()
+
+    def changeEvent(self, event) -> None:
+        if event.type() == QEvent.Type.FontChange:
+            self._row_h = self._measure_row_height()
+            self.updateGeometry()
+        super().changeEvent(event)
 
     # ------------------------------------------------------------------
-    # STYLE
+    # PAINTING
     # ------------------------------------------------------------------
 
-    def _apply_style(self) -> None:
-        if self.secondary:
-            self.setObjectName("SidebarItemSecondary")
-        else:
-            self.setObjectName("SidebarItem")
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        palette = self.palette()
+        row_h = self._row_h
+        width = self.width()
+        align = Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft
+
+        text_color = palette.color(
+            QPalette.ColorRole.PlaceholderText if self.secondary else QPalette.ColorRole.WindowText
+        )
+        disabled_color = palette.color(QPalette.ColorGroup.Disabled, QPalette.ColorRole.WindowText)
+
+        for row, idx in enumerate(self._rows):
+            rect = QRect(0, row * row_h, width, row_h)
+
+            if idx == self._active_idx:
+                painter.fillRect(rect, palette.color(QPalette.ColorRole.Highlight))
+                painter.setPen(palette.color(QPalette.ColorRole.HighlightedText))
+            else:
+                painter.setPen(text_color if self._enabled[idx] else disabled_color)
 
-    def set_active(self, active: bool) -> None:
-        self._active = active
-        self.setProperty("active", active)
-        self.style().polish(self)
+            painter.drawText(rect.adjusted(ROW_PADDING_X, 0, 0, 0), align, self._labels[idx])
 
     # ------------------------------------------------------------------
     # INTERACTION
     # ------------------------------------------------------------------
 
     def mousePressEvent(self, event) -> None:
-        if not self.isEnabled():
+        row = int(event.position().y()) // self._row_h
+        if not 0 <= row < len(self._rows):
             return
 
-        if self._permissions.is_route_allowed(self.route):
-            self._signals.route_requested.emit(self.route)
+        idx = self._rows[row]
+        if self._enabled[idx]:
+            self._signals.route_requested.emit(self._routes[idx])
 
     # ------------------------------------------------------------------
-    # PERMISSIONS
+    # STATE
     # ------------------------------------------------------------------
 
-    def update_permissions(self) -> None:
-        allowed = self._permissions.is_route_allowed(self.route)
-        self.setEnabled(allowed)
-        self.setVisible(allowed or self.secondary)
+    def refresh(self) -> None:
+        """
+        Re-evaluate permissions: flip enabled bytes, recompute drawn rows.
+
+        Primary rows are hidden when not allowed; secondary rows stay
+        visible but disabled.
+        """
+        allowed = self._permissions.is_route_allowed
+        for idx, route in enumerate(self._routes):
+            self._enabled[idx] = allowed(route)
+
+        rows = [
+            idx for idx in range(len(self._routes))
+            if self._enabled[idx] or self.secondary
+        ]
+        if rows != self._rows:
+            self._rows = rows
+            self.updateGeometry()
+
+        self.update()
+
+    def set_active_route(self, route: str) -> None:
+        try:
+            # Route literals are interned; interning the incoming signal
+            # argument makes every compare an identity check.
+            idx = self._routes.index(sys.intern(route))
+        except ValueError:
+            idx = -1
+
+        if idx == self._active_idx:
+            return
+
+        # Repaint only the rows that changed, not the whole list
+        previous, self._active_idx = self._active_idx, idx
+        self._update_row(previous)
+        self._update_row(idx)
+
+    def _update_row(self, idx: int) -> None:
+        if idx in self._rows:
+            row = self._rows.index(idx)
+            self.update(QRect(0, row * self._row_h, self.width(), self._row_h))
@@ -22,13 +22,15 @@ from __future__ import annotations
 import logging
 from typing import Optional
 
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QElapsedTimer, QTimer, pyqtSlot
+from PyQt6.QtGui import QColor, QPalette
 from PyQt6.QtWidgets import (
     QFrame,
     QHBoxLayout,
     QLabel,
     QProgressBar,
     QSizePolicy,
+    QWidget,
 )
 
 from desktop_gui.core.signals import get_signals
@@ -36,6 +38,24 @@ from desktop_gui.core.app_state import get_app_state
 
 logger = logging.getLogger("nosis.statusbar")
 
+ERROR_TEXT_COLOR = "#ff5c5c"
+
+# Progress bar writes are coalesced to at most one per frame (~60 Hz)
+PROGRESS_REPAINT_INTERVAL_MS = 16
+
+
+def _set_style_property(widget: QWidget, name: str, value: str) -> None:
+    """
+    Restyle via a dynamic property (QLabel[status="online"] etc.).
+
+    The style is only re-polished when the value actually changes,
+    so repeated notifications of the same kind cost a property read.
+    """
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    widget.style().polish(widget)
+
 
 # =============================================================================
 # STATUS BAR
@@ -63,9 +83,15 @@ class StatusBar(QFrame):
         self.setFrameShape(QFrame.Shape.NoFrame)
         self.setFixedHeight(32)
 
+        # Auto-clear is deadline based: new messages only move the
+        # deadline, and the one timer re-arms itself if it fires early.
+        self._elapsed = QElapsedTimer()
+        self._elapsed.start()
+        self._clear_deadline_ms: Optional[int] = None
+
         self._clear_timer = QTimer(self)
         self._clear_timer.setSingleShot(True)
-        self._clear_timer.timeout.connect(self._clear_message)
+        self._clear_timer.timeout.connect(self._on_clear_timeout)
 
         self._init_ui()
         self._connect_signals()
@@ -83,7 +109,8 @@ class StatusBar(QFrame):
 
         # Backend status
         self.backend_status = QLabel("● Offline")
-        self.backend_status.setObjectName("StatusBackendOffline")
+        self.backend_status.setObjectName("StatusBackend")
+        self.backend_status.setProperty("status", "offline")
         layout.addWidget(self.backend_status)
 
         # Progress
@@ -95,6 +122,13 @@ class StatusBar(QFrame):
         self.progress.setTextVisible(False)
         layout.addWidget(self.progress)
 
+        self._pending_progress: Optional[int] = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(PROGRESS_REPAINT_INTERVAL_MS)
+        self._progress_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
         # Message
         self.message = QLabel("")
         self.message.setObjectName("StatusMessage")
@@ -104,51 +138,85 @@ class StatusBar(QFrame):
         )
         layout.addWidget(self.message)
 
+        # Message severity is a palette swap, not a QSS restyle
+        self._pal_normal = QPalette(self.message.palette())
+        self._pal_error = QPalette(self._pal_normal)
+        self._pal_error.setColor(QPalette.ColorRole.WindowText, QColor(ERROR_TEXT_COLOR))
+        self._message_error = False
+
     # ------------------------------------------------------------------
     # SIGNALS
     # ------------------------------------------------------------------
 
     def _connect_signals(self) -> None:
+        # Signals emitted from bridge coroutines are queued, so slot
+        # repaints run after the emitting coroutine yields instead of
+        # inline inside the request / stream handler. The generation and
+        # notification family shares one connection type so the slots run
+        # in emit order (a late progress or notice cannot overwrite
+        # "Completed" / "Error: ...").
+        queued = Qt.ConnectionType.QueuedConnection
+
         # Backend connectivity
-        self._signals.backend_connected.connect(self._on_backend_connected)
-        self._signals.backend_disconnected.connect(self._on_backend_disconnected)
+        self._signals.backend_connected.connect(self._on_backend_connected, queued)
+        self._signals.backend_disconnected.connect(self._on_backend_disconnected, queued)
 
         # Progress
-        self._signals.generation_started.connect(self._on_progress_start)
-        self._signals.generation_progress.connect(self._on_progress_update)
-        self._signals.generation_finished.connect(self._on_progress_finish)
-        self._signals.generation_failed.connect(self._on_error)
+        self._signals.generation_started.connect(self._on_progress_start, queued)
+        self._signals.generation_progress.connect(self._on_progress_update, queued)
+        self._signals.generation_finished.connect(self._on_progress_finish, queued)
+        self._signals.generation_failed.connect(self._on_error, queued)
 
         # Notifications
-        self._signals.notification.connect(self._on_notification)
+        self._signals.notification.connect(self._on_notification, queued)
 
     # ------------------------------------------------------------------
     # BACKEND STATE
     # ------------------------------------------------------------------
 
+    @pyqtSlot()
     def _on_backend_connected(self):
         self.backend_status.setText("● Connected")
-        self.backend_status.setObjectName("StatusBackendOnline")
-        self.backend_status.style().polish(self.backend_status)
+        _set_style_property(self.backend_status, "status", "online")
 
+    @pyqtSlot()
     def _on_backend_disconnected(self):
         self.backend_status.setText("● Offline")
-        self.backend_status.setObjectName("StatusBackendOffline")
-        self.backend_status.style().polish(self.backend_status)
+        _set_style_property(self.backend_status, "status", "offline")
 
     # ------------------------------------------------------------------
     # PROGRESS
     # ------------------------------------------------------------------
 
+    @pyqtSlot()
     def _on_progress_start(self):
+        self._cancel_pending_progress()
         self.progress.setVisible(True)
         self.progress.setValue(0)
         self._set_message("Processing…")
 
+    @pyqtSlot(float)
     def _on_progress_update(self, value: float):
-        self.progress.setValue(int(value * 100))
-
+        # Only the latest value is kept; the bar repaints once per tick
+        self._pending_progress = int(value * 100)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    @pyqtSlot()
+    def _flush_progress(self):
+        value = self._pending_progress
+        self._pending_progress = None
+        if value is None or value == self.progress.value():
+            return
+        self.progress.setValue(value)
+
+    def _cancel_pending_progress(self):
+        self._progress_timer.stop()
+        self._pending_progress = None
+
+    @pyqtSlot(dict)
     def _on_progress_finish(self, *_):
+        self._cancel_pending_progress()
         self.progress.setValue(100)
         self.progress.setVisible(False)
         self._set_message("Completed", auto_clear=True)
@@ -157,11 +225,15 @@ class StatusBar(QFrame):
     # ERRORS / MESSAGES
     # ------------------------------------------------------------------
 
+    @pyqtSlot(str)
     def _on_error(self, message: str):
         logger.error("StatusBar error: %s", message)
+        self._cancel_pending_progress()
         self.progress.setVisible(False)
         self._set_message(f"Error: {message}", error=True)
 
+    @pyqtSlot(str)
+    @pyqtSlot(str, object)
     def _on_notification(self, message: str, level: str = "info"):
         """
         Generic notifications from bridge layer.
@@ -177,17 +249,32 @@ class StatusBar(QFrame):
         auto_clear: bool = False,
     ):
         self.message.setText(text)
+        if error != self._message_error:
+            self._message_error = error
+            self.message.setPalette(self._pal_error if error else self._pal_normal)
 
-        if error:
-            self.message.setObjectName("StatusMessageError")
-        else:
-            self.message.setObjectName("StatusMessage")
+        if not auto_clear:
+            self._clear_deadline_ms = None
+            return
 
-        self.message.style().polish(self.message)
-
-        self._clear_timer.stop()
-        if auto_clear:
+        self._clear_deadline_ms = self._elapsed.elapsed() + self.AUTO_CLEAR_MESSAGE_MS
+        if not self._clear_timer.isActive():
             self._clear_timer.start(self.AUTO_CLEAR_MESSAGE_MS)
 
+    @pyqtSlot()
+    def _on_clear_timeout(self):
+        deadline = self._clear_deadline_ms
+        if deadline is None:
+            return  # a persistent message replaced the auto-clear one
+
+        remaining = deadline - self._elapsed.elapsed()
+        if remaining > 0:
+            self._clear_timer.start(remaining)
+            return
+
+        self._clear_deadline_ms = None
+        self._clear_message()
+
+    @pyqtSlot()
     def _clear_message(self):
         self.message.setText("")
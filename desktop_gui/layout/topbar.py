@@ -19,9 +19,10 @@ All actions emitted via signals
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from typing import Any, Optional, Tuple
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QEvent, Qt, QTimer, pyqtSlot
+from PyQt6.QtGui import QPainter
 from PyQt6.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -61,6 +62,16 @@ class TopBar(QFrame):
         self.setFrameShape(QFrame.Shape.NoFrame)
         self.setFixedHeight(56)
 
+        # Login emits several of the refresh signals back to back;
+        # they collapse into one pass on the next event-loop turn.
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+
+        # Inputs of the last applied refresh; equal inputs skip all widget writes
+        self._last_state: Optional[Tuple[Any, ...]] = None
+
         self._init_ui()
         self._connect_signals()
 
@@ -104,30 +115,52 @@ class TopBar(QFrame):
         self.user_label.setObjectName("TopBarUser")
         layout.addWidget(self.user_label)
 
-        self._refresh()
+        self._do_refresh()
 
     # ------------------------------------------------------------------
     # SIGNALS
     # ------------------------------------------------------------------
 
     def _connect_signals(self) -> None:
-        self._signals.user_logged_in.connect(self._refresh)
-        self._signals.user_logged_out.connect(self._refresh)
-        self._signals.credits_updated.connect(self._refresh)
-        self._signals.mode_changed.connect(self._refresh)
-        self._signals.project_dirty_changed.connect(self._update_dirty_state)
+        # Emitted on the GUI thread only: skip AutoConnection's thread check
+        direct = Qt.ConnectionType.DirectConnection
+
+        self._signals.user_logged_in.connect(self._refresh, direct)
+        self._signals.user_logged_out.connect(self._refresh, direct)
+        self._signals.credits_updated.connect(self._refresh, direct)
+        self._signals.mode_changed.connect(self._refresh, direct)
+        self._signals.project_dirty_changed.connect(self._update_dirty_state, direct)
 
     # ------------------------------------------------------------------
     # STATE
     # ------------------------------------------------------------------
 
+    @pyqtSlot()
+    @pyqtSlot(int)
+    @pyqtSlot(str)
     def _refresh(self, *_):
+        """
+        Schedule a sync with AppState.
+
+        Not re-armed while a refresh is already pending.
+        """
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    @pyqtSlot()
+    def _do_refresh(self):
         """
         Sync UI with AppState.
         """
         user = self._state.user
         mode = self._state.mode
         credits = self._state.credits
+        can_save = self._permissions.can_save_project()
+
+        state = (user.authenticated, user.username, user.plan, mode, credits, can_save)
+        if state == self._last_state:
+            return
+        self._last_state = state
 
         # Mode
         self.mode_label.setText(f"Mode: {mode.capitalize()}")
@@ -145,23 +178,27 @@ class TopBar(QFrame):
             self.user_label.setText("Not signed in")
 
         # Permissions
-        self.save_btn.setEnabled(self._permissions.can_save_project())
-        self.save_as_btn.setEnabled(self._permissions.can_save_project())
+        self.save_btn.setEnabled(can_save)
+        self.save_as_btn.setEnabled(can_save)
 
+    @pyqtSlot(bool)
     def _update_dirty_state(self, dirty: bool):
         """
         Visual hint when project has unsaved changes.
         """
-        suffix = "*" if dirty else ""
-        self.save_btn.setText(f"Save{suffix}")
+        # Text stays "Save": the marker is painted, so the button's
+        # size hint and the bar layout are never invalidated.
+        self.save_btn.set_dirty(dirty)
 
     # ------------------------------------------------------------------
     # ACTIONS
     # ------------------------------------------------------------------
 
+    @pyqtSlot()
     def _on_save(self):
         self._signals.project_save_requested.emit()
 
+    @pyqtSlot()
     def _on_save_as(self):
         self._signals.project_save_as_requested.emit()
 
@@ -180,3 +217,42 @@ class TopBarButton(QPushButton):
         self.setObjectName("TopBarButton")
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        self._dirty = False
+
+        # Text never changes after construction: the size is pinned (with
+        # room for the dirty marker) so the layout never has to re-query
+        # sizeHint(); it is only re-measured when font or style change.
+        self._pin_size()
+
+    def _pin_size(self) -> None:
+        hint = self.sizeHint()
+        marker = self.fontMetrics().horizontalAdvance("*")
+        self.setFixedSize(hint.width() + marker, hint.height())
+
+    def changeEvent(self, event) -> None:
+        if event.type() in (QEvent.Type.FontChange, QEvent.Type.StyleChange):
+            self._pin_size()
+        super().changeEvent(event)
+
+    def set_dirty(self, dirty: bool) -> None:
+        """
+        Toggle the unsaved-changes marker (repaint only, no relayout).
+        """
+        if dirty == self._dirty:
+            return
+        self._dirty = dirty
+        self.update()
+
+    def paintEvent(self, event) -> None:
+        super().paintEvent(event)
+        if not self._dirty:
+            return
+
+        painter = QPainter(self)
+        painter.setPen(self.palette().buttonText().color())
+        painter.drawText(
+            self.rect().adjusted(0, 2, -4, 0),
+            Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignRight,
+            "*",
+        )
+        painter.end()
@@ -16,8 +16,13 @@ from __future__ import annotations
 
 import sys
 import os
+import asyncio
+import atexit
+import functools
+import queue
 import signal
 import logging
+import logging.handlers
 from pathlib import Path
 from typing import Optional
 
@@ -26,14 +31,9 @@ from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QFont, QIcon
 from PyQt6.QtCore import Qt
 
-# --- Async / event loop integration ---
-import qasync
-
-# --- Optional theming ---
-import qdarktheme
-
 # --- Internal imports (no circular dependencies) ---
 from layout.main_window import MainWindow
+from desktop_gui.core.event_loop import create_qt_event_loop
 
 # =============================================================================
 # GLOBAL PATHS & CONSTANTS
@@ -47,20 +47,40 @@ ROOT_DIR = Path(__file__).resolve().parents[1]
 ASSETS_DIR = ROOT_DIR / "desktop_gui" / "assets"
 LOG_DIR = ROOT_DIR / "logs" / "desktop_gui"
 
-LOG_DIR.mkdir(parents=True, exist_ok=True)
+# Set to "1" to skip qdarktheme (and its import) entirely
+NO_THEME_ENV = "NOSIS_NO_THEME"
 
 # =============================================================================
 # LOGGING (enterprise-level, safe by default)
 # =============================================================================
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-    handlers=[
+def _init_logging() -> None:
+    """
+    Configure root logging; called from main(), never at import.
+
+    Slots log on the GUI thread; a QueueListener thread does the file /
+    stdout writes so an error burst never blocks the event loop on I/O.
+    """
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+
+    listener = logging.handlers.QueueListener(
+        log_queue,
         logging.FileHandler(LOG_DIR / "gui.log", encoding="utf-8"),
         logging.StreamHandler(sys.stdout),
-    ],
-)
+    )
+
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(
+        logging.Formatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s")
+    )
+
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+
+    listener.start()
+    atexit.register(listener.stop)
+
 
 logger = logging.getLogger("nosis.gui")
 
@@ -75,21 +95,69 @@ def _ensure_correct_environment() -> None:
     if sys.version_info < (3, 10):
         raise RuntimeError("Python 3.10+ is required for NOSIS Desktop GUI")
 
-    # Prevent Qt from silently misbehaving on HiDPI screens
-    os.environ.setdefault("QT_ENABLE_HIGHDPI_SCALING", "1")
-    os.environ.setdefault("QT_AUTO_SCREEN_SCALE_FACTOR", "1")
-    os.environ.setdefault("QT_SCALE_FACTOR_ROUNDING_POLICY", "PassThrough")
+# =============================================================================
+# SHARED RESOURCES
+# =============================================================================
+
+APP_ICON_PATH = ASSETS_DIR / "icons" / "nosis.ico"
+
+# Built lazily (QFont / QIcon need a QGuiApplication) and then reused,
+# so the .ico is stat'ed, read and decoded at most once per process.
+
+@functools.cache
+def get_app_font() -> QFont:
+    # Deferred: importing desktop_gui.app configures logging, which must
+    # not pre-empt _init_logging()
+    from desktop_gui.app import get_default_font
+
+    return get_default_font()
+
+
+@functools.cache
+def get_app_icon() -> Optional[QIcon]:
+    """
+    Application icon, or None when the asset is missing.
+    """
+    if not APP_ICON_PATH.exists():
+        return None
+    return QIcon(str(APP_ICON_PATH))
 
 # =============================================================================
 # APPLICATION FACTORY
 # =============================================================================
 
+def _apply_theme(app: QApplication) -> None:
+    """
+    Apply qdarktheme; imported here so startup only pays for it when used.
+    """
+    # Fusion gives qdarktheme a known base style to restyle
+    app.setStyle("Fusion")
+    try:
+        import qdarktheme
+
+        qdarktheme.setup_theme(
+            theme="dark",
+            custom_colors={
+                "primary": "#2563EB",   # Microsoft-like blue
+            },
+        )
+        logger.info("Dark theme applied (qdarktheme)")
+    except Exception as exc:
+        logger.warning("Failed to apply theme: %s", exc)
+
+
 def create_application(argv: list[str]) -> QApplication:
     """
     Create and configure QApplication in a controlled, testable way.
     """
     _ensure_correct_environment()
 
+    # High-DPI scaling and pixmaps are always on in Qt 6; only the rounding
+    # policy is configurable, and it must be set before construction.
+    QApplication.setHighDpiScaleFactorRoundingPolicy(
+        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
+    )
+
     app = QApplication(argv)
 
     # --- Application metadata ---
@@ -97,30 +165,18 @@ def create_application(argv: list[str]) -> QApplication:
     app.setOrganizationName(APP_ORG)
     app.setApplicationVersion(APP_VERSION)
 
-    # --- High DPI / rendering flags ---
-    QApplication.setAttribute(Qt.ApplicationAttribute.AA_UseHighDpiPixmaps, True)
-
     # --- Global font (Inter, fallback-safe) ---
-    font = QFont("Inter")
-    font.setPointSize(10)
-    app.setFont(font)
+    app.setFont(get_app_font())
 
     # --- Theme (Fluent-like base, overridable later) ---
-    try:
-        qdarktheme.setup_theme(
-            theme="dark",
-            custom_colors={
-                "primary": "#2563EB",   # Microsoft-like blue
-            },
-        )
-        logger.info("Dark theme applied (qdarktheme)")
-    except Exception as exc:
-        logger.warning("Failed to apply theme: %s", exc)
+    # NOSIS_NO_THEME=1 keeps the platform's native style untouched
+    if os.environ.get(NO_THEME_ENV) != "1":
+        _apply_theme(app)
 
     # --- App icon (optional but enterprise-standard) ---
-    icon_path = ASSETS_DIR / "icons" / "nosis.ico"
-    if icon_path.exists():
-        app.setWindowIcon(QIcon(str(icon_path)))
+    icon = get_app_icon()
+    if icon is not None:
+        app.setWindowIcon(icon)
 
     return app
 
@@ -133,12 +189,13 @@ def main() -> int:
     Main GUI entrypoint.
     This function is intentionally minimal, explicit, and testable.
     """
+    _init_logging()
     logger.info("Starting NOSIS Desktop GUI")
 
     # --- Async-compatible Qt event loop ---
     app = create_application(sys.argv)
-    loop = qasync.QEventLoop(app)
-    qasync.asyncio.set_event_loop(loop)
+    loop = create_qt_event_loop(app)
+    asyncio.set_event_loop(loop)
 
     # --- Graceful shutdown handling ---
     def _graceful_exit(*_):
@@ -157,7 +214,7 @@ def main() -> int:
 
         logger.info("Main window shown successfully")
 
-        # --- Run event loop ---
+        # --- Run event loop (returns the QApplication exit code) ---
         with loop:
             exit_code = loop.run_forever()
 
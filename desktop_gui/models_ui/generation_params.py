@@ -14,13 +14,14 @@ Acts as the single source of truth between:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import MISSING, dataclass, field, fields
 from enum import Enum
-from typing import List, Dict, Optional, Any
-import json
+from typing import List, Dict, Optional, Any, Callable, Tuple, Type, TypeVar
 import uuid
 import time
 
+import orjson
+
 
 # =========================
 # ENUMS
@@ -52,54 +53,97 @@ class StereoMode(str, Enum):
 # CORE BLOCKS
 # =========================
 
-@dataclass
+@dataclass(slots=True)
 class PromptBlock:
     lyrics: str = ""
     style: str = ""
     negative: str = ""
     max_characters: int = 10000
 
-    def validate(self) -> List[str]:
+    def _as_dict(self) -> Dict[str, Any]:
+        return {
+            "lyrics": self.lyrics,
+            "style": self.style,
+            "negative": self.negative,
+            "max_characters": self.max_characters,
+        }
+
+    def is_valid(self) -> bool:
+        return (
+            len(self.lyrics) <= self.max_characters
+            and len(self.style) <= self.max_characters
+        )
+
+    def validate(self) -> Tuple[str, ...]:
+        if self.is_valid():
+            return ()
         errors = []
         if len(self.lyrics) > self.max_characters:
             errors.append("Lyrics prompt exceeds maximum length")
         if len(self.style) > self.max_characters:
             errors.append("Style prompt exceeds maximum length")
-        return errors
+        return tuple(errors)
 
 
-@dataclass
+@dataclass(slots=True)
 class ReferenceAudio:
     path: str
     weight_structure: float = 0.5
     weight_timbre: float = 0.5
     weight_style: float = 0.5
 
+    def _as_dict(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "weight_structure": self.weight_structure,
+            "weight_timbre": self.weight_timbre,
+            "weight_style": self.weight_style,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class ReferenceBlock:
     audios: List[ReferenceAudio] = field(default_factory=list)
     max_references: int = 10
 
-    def validate(self) -> List[str]:
-        errors = []
-        if len(self.audios) > self.max_references:
-            errors.append("Too many reference audios")
-        return errors
+    def _as_dict(self) -> Dict[str, Any]:
+        return {
+            "audios": [a._as_dict() for a in self.audios],
+            "max_references": self.max_references,
+        }
+
+    def is_valid(self) -> bool:
+        return len(self.audios) <= self.max_references
 
+    def validate(self) -> Tuple[str, ...]:
+        if self.is_valid():
+            return ()
+        return ("Too many reference audios",)
 
-@dataclass
+
+@dataclass(slots=True)
 class GenreBlock:
     primary: str = ""
     secondary: List[str] = field(default_factory=list)
     interpolation_depth: float = 0.5
     novelty_bias: float = 0.5
 
-    def validate(self) -> List[str]:
-        return []
+    def _as_dict(self) -> Dict[str, Any]:
+        return {
+            "primary": self.primary,
+            "secondary": list(self.secondary),
+            "interpolation_depth": self.interpolation_depth,
+            "novelty_bias": self.novelty_bias,
+        }
+
+    def is_valid(self) -> bool:
+        return True
 
+    def validate(self) -> Tuple[str, ...]:
+        return ()
 
-@dataclass
+
+@dataclass(slots=True)
 class VoiceBlock:
     enabled: bool = True
     language: str = "en"
@@ -109,16 +153,35 @@ class VoiceBlock:
     choir_mode: bool = False
     realism_noise: float = 0.15
 
+    def _as_dict(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "language": self.language,
+            "gender": self.gender,
+            "voice_type": self.voice_type,
+            "emotion": self.emotion,
+            "choir_mode": self.choir_mode,
+            "realism_noise": self.realism_noise,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class MusicTheoryBlock:
     bpm: Optional[int] = None
     key: Optional[str] = None
     time_signature: Optional[str] = None
     structure: Optional[str] = None
 
+    def _as_dict(self) -> Dict[str, Any]:
+        return {
+            "bpm": self.bpm,
+            "key": self.key,
+            "time_signature": self.time_signature,
+            "structure": self.structure,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class AdvancedControls:
     randomness: float = 0.5
     prompt_accuracy: float = 0.8
@@ -128,8 +191,19 @@ class AdvancedControls:
     quality_gate: bool = True
     multi_pass: int = 1
 
+    def _as_dict(self) -> Dict[str, Any]:
+        return {
+            "randomness": self.randomness,
+            "prompt_accuracy": self.prompt_accuracy,
+            "reference_similarity": self.reference_similarity,
+            "semantic_lock": self.semantic_lock,
+            "style_lock": self.style_lock,
+            "quality_gate": self.quality_gate,
+            "multi_pass": self.multi_pass,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class OutputBlock:
     format: OutputFormat = OutputFormat.WAV
     stereo: StereoMode = StereoMode.STEREO
@@ -137,12 +211,101 @@ class OutputBlock:
     bit_depth: int = 24
     mastering: bool = True
 
+    def _as_dict(self) -> Dict[str, Any]:
+        return {
+            "format": self.format.value,
+            "stereo": self.stereo.value,
+            "sample_rate": self.sample_rate,
+            "bit_depth": self.bit_depth,
+            "mastering": self.mastering,
+        }
+
+
+# =========================
+# DECODING HELPERS
+# =========================
+
+_T = TypeVar("_T")
+_E = TypeVar("_E", bound=Enum)
+
+# (name, default, default_factory) per field, in __init__ order
+_FieldSpec = Tuple[Tuple[str, Any, Optional[Callable[[], Any]]], ...]
+
+
+def _field_spec(cls: type) -> _FieldSpec:
+    return tuple(
+        (
+            f.name,
+            f.default,
+            None if f.default_factory is MISSING else f.default_factory,
+        )
+        for f in fields(cls)
+    )
+
+
+def _mk(cls: Type[_T], spec: _FieldSpec, data: Optional[Dict[str, Any]]) -> _T:
+    """
+    Build a block positionally from a decoded dict.
+
+    Unknown keys are ignored; missing keys take the field default.
+    """
+    if not data:
+        data = {}
+    args = []
+    for name, default, factory in spec:
+        if name in data:
+            args.append(data[name])
+        elif factory is not None:
+            args.append(factory())
+        elif default is MISSING:
+            raise TypeError(f"{cls.__name__} missing required field '{name}'")
+        else:
+            args.append(default)
+    return cls(*args)
+
+
+# value -> member; a dict probe instead of EnumMeta.__call__
+_MODE_MEMBERS: Dict[Any, GenerationMode] = GenerationMode._value2member_map_
+_FORMAT_MEMBERS: Dict[Any, OutputFormat] = OutputFormat._value2member_map_
+_STEREO_MEMBERS: Dict[Any, StereoMode] = StereoMode._value2member_map_
+
+
+def _member(members: Dict[Any, _E], enum_cls: Type[_E], value: Any, default: _E) -> _E:
+    """
+    Resolve a decoded enum value; None takes the default.
+
+    Misses fall through to the Enum constructor, which raises ValueError,
+    so a bad value never silently becomes the default.
+    """
+    if value is None:
+        return default
+    member = members.get(value)
+    return member if member is not None else enum_cls(value)
+
+def _mk_audio(a: Dict[str, Any]) -> ReferenceAudio:
+    # Hot per-reference path: fixed positional args, no spec loop
+    get = a.get
+    return ReferenceAudio(
+        a["path"],
+        get("weight_structure", 0.5),
+        get("weight_timbre", 0.5),
+        get("weight_style", 0.5),
+    )
+
+
+_PROMPT_FIELDS = _field_spec(PromptBlock)
+_GENRE_FIELDS = _field_spec(GenreBlock)
+_VOICE_FIELDS = _field_spec(VoiceBlock)
+_THEORY_FIELDS = _field_spec(MusicTheoryBlock)
+_ADVANCED_FIELDS = _field_spec(AdvancedControls)
+_OUTPUT_FIELDS = _field_spec(OutputBlock)
+
 
 # =========================
 # ROOT PARAM OBJECT
 # =========================
 
-@dataclass
+@dataclass(slots=True)
 class GenerationParams:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     created_at: float = field(default_factory=time.time)
@@ -165,45 +328,90 @@ class GenerationParams:
     # VALIDATION
     # ---------------------
 
-    def validate(self) -> List[str]:
-        errors: List[str] = []
-        errors.extend(self.prompt.validate())
-        errors.extend(self.references.validate())
-        errors.extend(self.genre.validate())
-        return errors
+    def is_valid(self) -> bool:
+        """
+        Allocation-free check for per-change UI validation.
+        """
+        return (
+            self.prompt.is_valid()
+            and self.references.is_valid()
+            and self.genre.is_valid()
+        )
+
+    def validate(self) -> Tuple[str, ...]:
+        # Success path returns the shared empty tuple; messages are
+        # only built when something actually failed.
+        if self.is_valid():
+            return ()
+        return (
+            self.prompt.validate()
+            + self.references.validate()
+            + self.genre.validate()
+        )
 
     # ---------------------
     # SERIALIZATION
     # ---------------------
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Explicit field walk: dataclasses.asdict deep-copies every value
+        return {
+            "id": self.id,
+            "created_at": self.created_at,
+            "version": self.version,
+            "mode": self.mode.value,
+            "prompt": self.prompt._as_dict(),
+            "references": self.references._as_dict(),
+            "genre": self.genre._as_dict(),
+            "voice": self.voice._as_dict(),
+            "theory": self.theory._as_dict(),
+            "advanced": self.advanced._as_dict(),
+            "output": self.output._as_dict(),
+            "context": dict(self.context),
+        }
 
     def to_json(self, pretty: bool = False) -> str:
+        option = orjson.OPT_NON_STR_KEYS
         if pretty:
-            return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
-        return json.dumps(self.to_dict(), ensure_ascii=False)
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(self.to_dict(), option=option).decode()
 
     @staticmethod
     def from_json(data: str) -> "GenerationParams":
-        raw = json.loads(data)
+        raw = orjson.loads(data)
         return GenerationParams._from_dict(raw)
 
+    @staticmethod
+    def from_json_bulk(blob: bytes | str) -> List["GenerationParams"]:
+        """
+        Decode a JSON array of params (project history) in one orjson pass.
+        """
+        from_dict = GenerationParams._from_dict
+        return [from_dict(d) for d in orjson.loads(blob)]
+
     @staticmethod
     def _from_dict(data: Dict[str, Any]) -> "GenerationParams":
+        references = data.get("references") or {}
+
+        output = _mk(OutputBlock, _OUTPUT_FIELDS, data.get("output"))
+        # Decoded JSON carries plain strings; to_dict expects the enums
+        output.format = _member(_FORMAT_MEMBERS, OutputFormat, output.format, OutputFormat.WAV)
+        output.stereo = _member(_STEREO_MEMBERS, StereoMode, output.stereo, StereoMode.STEREO)
+
         return GenerationParams(
-            id=data.get("id"),
-            created_at=data.get("created_at", time.time()),
-            version=data.get("version", 1),
-            mode=GenerationMode(data.get("mode", GenerationMode.SONG)),
-            prompt=PromptBlock(**data.get("prompt", {})),
-            references=ReferenceBlock(
-                audios=[ReferenceAudio(**a) for a in data.get("references", {}).get("audios", [])]
+            data.get("id"),
+            data.get("created_at", time.time()),
+            data.get("version", 1),
+            _member(_MODE_MEMBERS, GenerationMode, data.get("mode"), GenerationMode.SONG),
+            _mk(PromptBlock, _PROMPT_FIELDS, data.get("prompt")),
+            ReferenceBlock(
+                [_mk_audio(a) for a in references.get("audios", ())],
+                references.get("max_references", 10),
             ),
-            genre=GenreBlock(**data.get("genre", {})),
-            voice=VoiceBlock(**data.get("voice", {})),
-            theory=MusicTheoryBlock(**data.get("theory", {})),
-            advanced=AdvancedControls(**data.get("advanced", {})),
-            output=OutputBlock(**data.get("output", {})),
-            context=data.get("context", {}),
+            _mk(GenreBlock, _GENRE_FIELDS, data.get("genre")),
+            _mk(VoiceBlock, _VOICE_FIELDS, data.get("voice")),
+            _mk(MusicTheoryBlock, _THEORY_FIELDS, data.get("theory")),
+            _mk(AdvancedControls, _ADVANCED_FIELDS, data.get("advanced")),
+            output,
+            data.get("context", {}),
         )
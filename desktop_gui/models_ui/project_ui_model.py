@@ -2,30 +2,30 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from operator import attrgetter
+from typing import Dict, List, Optional, Any, Tuple
 from uuid import uuid4
 from datetime import datetime
+import time
 
 try:
     from PyQt6.QtCore import QObject, pyqtSignal
 except ImportError:
     QObject = object
-    def pyqtSignal(*args, **kwargs):
-        return None
 
+    class _NullSignal:
+        """No-op stand-in so emit() call sites need no None guards."""
+        def connect(self, *args, **kwargs) -> None:
+            pass
 
-class ProjectSignals(QObject):
-    """
-    Centralized signal bus for Project UI Model.
-    """
-    projectChanged = pyqtSignal()
-    trackAdded = pyqtSignal(str)
-    trackRemoved = pyqtSignal(str)
-    projectSaved = pyqtSignal(str)
-    projectLoaded = pyqtSignal(str)
+        def emit(self, *args) -> None:
+            pass
 
+    def pyqtSignal(*args, **kwargs):
+        return _NullSignal()
 
-@dataclass
+
+@dataclass(slots=True)
 class ProjectMetadata:
     """
     Metadata describing the project.
@@ -41,7 +41,7 @@ class ProjectMetadata:
     time_signature: str = "4/4"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectSettings:
     """
     Global project-level settings.
@@ -54,6 +54,18 @@ class ProjectSettings:
     auto_save_interval_sec: int = 120
 
 
+# to_dict schema, specialized once: key tuples plus C-level attrgetters
+# reading every serialized attribute of a block in one call.
+_METADATA_KEYS: Tuple[str, ...] = (
+    "title", "author", "description", "tags", "genre", "bpm", "time_signature",
+)
+_SETTINGS_KEYS: Tuple[str, ...] = (
+    "sample_rate", "bit_depth", "stereo", "loudness_target_lufs",
+)
+_get_metadata = attrgetter(*_METADATA_KEYS)
+_get_settings = attrgetter(*_SETTINGS_KEYS)
+
+
 class ProjectUIModel(QObject):
     """
     Enterprise-grade Project UI Model.
@@ -63,50 +75,68 @@ class ProjectUIModel(QObject):
     - Synchronization point between Create / Studio / Chat
     - Emits signals for reactive UI updates
     - Safe for enterprise-scale feature growth
+
+    Signals live on the model itself (one QObject per project).
     """
 
+    projectChanged = pyqtSignal()
+    trackAdded = pyqtSignal(str)
+    trackRemoved = pyqtSignal(str)
+    projectSaved = pyqtSignal(str)
+    projectLoaded = pyqtSignal(str)
+
     def __init__(self, metadata: ProjectMetadata, settings: Optional[ProjectSettings] = None):
         super().__init__()
         self.id: str = str(uuid4())
         self.metadata: ProjectMetadata = metadata
         self.settings: ProjectSettings = settings or ProjectSettings()
         self.tracks: Dict[str, Any] = {}
-        self.signals = ProjectSignals()
         self._dirty: bool = False
+        # Last mutation as an int (ns since epoch); metadata.updated_at is
+        # only materialized as a datetime when it is read out, so read it
+        # through the updated_at property.
+        self._updated_ns: Optional[int] = None
 
     def mark_dirty(self) -> None:
         self._dirty = True
-        self.metadata.updated_at = datetime.utcnow()
-        if self.signals.projectChanged:
-            self.signals.projectChanged.emit()
+        self._updated_ns = time.time_ns()
+        self.projectChanged.emit()
+
+    def _sync_updated_at(self) -> None:
+        if self._updated_ns is not None:
+            self.metadata.updated_at = datetime.utcfromtimestamp(self._updated_ns / 1e9)
+            self._updated_ns = None
+
+    @property
+    def updated_at(self) -> datetime:
+        """Time of the last mutation, synced into metadata on read."""
+        self._sync_updated_at()
+        return self.metadata.updated_at
 
     def is_dirty(self) -> bool:
         return self._dirty
 
     def save(self, path: str) -> None:
+        self._sync_updated_at()
         self._dirty = False
-        if self.signals.projectSaved:
-            self.signals.projectSaved.emit(path)
+        self.projectSaved.emit(path)
 
     def load(self, path: str) -> None:
         self._dirty = False
-        if self.signals.projectLoaded:
-            self.signals.projectLoaded.emit(path)
+        self.projectLoaded.emit(path)
 
     def add_track(self, track_model: Any) -> str:
         track_id = getattr(track_model, "track_id", str(uuid4()))
         self.tracks[track_id] = track_model
         self.mark_dirty()
-        if self.signals.trackAdded:
-            self.signals.trackAdded.emit(track_id)
+        self.trackAdded.emit(track_id)
         return track_id
 
     def remove_track(self, track_id: str) -> None:
         if track_id in self.tracks:
             del self.tracks[track_id]
             self.mark_dirty()
-            if self.signals.trackRemoved:
-                self.signals.trackRemoved.emit(track_id)
+            self.trackRemoved.emit(track_id)
 
     def get_track(self, track_id: str) -> Optional[Any]:
         return self.tracks.get(track_id)
@@ -122,23 +152,11 @@ class ProjectUIModel(QObject):
         self.mark_dirty()
 
     def to_dict(self) -> Dict[str, Any]:
+        self._sync_updated_at()
         return {
             "id": self.id,
-            "metadata": {
-                "title": self.metadata.title,
-                "author": self.metadata.author,
-                "description": self.metadata.description,
-                "tags": self.metadata.tags,
-                "genre": self.metadata.genre,
-                "bpm": self.metadata.bpm,
-                "time_signature": self.metadata.time_signature,
-            },
-            "settings": {
-                "sample_rate": self.settings.sample_rate,
-                "bit_depth": self.settings.bit_depth,
-                "stereo": self.settings.stereo,
-                "loudness_target_lufs": self.settings.loudness_target_lufs,
-            },
+            "metadata": dict(zip(_METADATA_KEYS, _get_metadata(self.metadata))),
+            "settings": dict(zip(_SETTINGS_KEYS, _get_settings(self.settings))),
             "tracks_count": len(self.tracks),
             "dirty": self._dirty,
         }
@@ -20,7 +20,7 @@ class TrackStatus(Enum):
     SOLO = "solo"
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginUIState:
     plugin_id: str
     name: str
@@ -28,14 +28,14 @@ class PluginUIState:
     parameters: Dict[str, float] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class AutomationLaneUI:
     parameter: str
     points: List[Dict[str, float]] = field(default_factory=list)
     visible: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackUIModel:
     """
     Enterprise-grade UI state model for a track.
@@ -58,7 +58,8 @@ class TrackUIModel:
     color: str = "#3A86FF"
     icon: Optional[str] = None
 
-    plugins: List[PluginUIState] = field(default_factory=list)
+    # Keyed by plugin_id; dict order keeps the insertion (chain) order
+    plugins: Dict[str, PluginUIState] = field(default_factory=dict)
     automation_lanes: List[AutomationLaneUI] = field(default_factory=list)
 
     generation_params_id: Optional[str] = None
@@ -84,10 +85,13 @@ class TrackUIModel:
         self.status = TrackStatus.SOLO if self.solo else TrackStatus.READY
 
     def add_plugin(self, plugin: PluginUIState):
-        self.plugins.append(plugin)
+        self.plugins[plugin.plugin_id] = plugin
 
     def remove_plugin(self, plugin_id: str):
-        self.plugins = [p for p in self.plugins if p.plugin_id != plugin_id]
+        self.plugins.pop(plugin_id, None)
+
+    def plugin_list(self) -> List[PluginUIState]:
+        return list(self.plugins.values())
 
     def add_automation_lane(self, lane: AutomationLaneUI):
         self.automation_lanes.append(lane)
@@ -1,9 +1,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Callable, Any
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
+from typing import Dict, List, Optional, Callable, Any, Tuple
 from enum import Enum
+import sys
 import uuid
 import time
 
@@ -40,7 +42,7 @@ class VoiceEmotion(Enum):
     INTIMATE = "intimate"
 
 
-@dataclass
+@dataclass(slots=True)
 class VoiceTechnicalProfile:
     pitch_range_min: float = 80.0
     pitch_range_max: float = 1200.0
@@ -53,7 +55,7 @@ class VoiceTechnicalProfile:
     clarity: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class VoiceStyleProfile:
     emotion: VoiceEmotion = VoiceEmotion.NEUTRAL
     intensity: float = 0.5
@@ -63,7 +65,7 @@ class VoiceStyleProfile:
     rhythmic_precision: float = 0.5
 
 
-@dataclass
+@dataclass(slots=True)
 class VoiceIdentity:
     voice_id: str = field(default_factory=lambda: str(uuid.uuid4()))
     name: str = "Unnamed Voice"
@@ -74,7 +76,20 @@ class VoiceIdentity:
     tags: List[str] = field(default_factory=list)
 
 
-@dataclass
+# Serialization schema, resolved once: interned field names plus a
+# C-level attrgetter that reads them all in one call.
+_IDENTITY_FIELDS: Tuple[str, ...] = tuple(sys.intern(f.name) for f in fields(VoiceIdentity))
+_TECHNICAL_FIELDS: Tuple[str, ...] = tuple(sys.intern(f.name) for f in fields(VoiceTechnicalProfile))
+_get_identity = attrgetter(*_IDENTITY_FIELDS)
+_get_technical = attrgetter(*_TECHNICAL_FIELDS)
+
+# Accepted keys for the set_* kwargs setters (set lookup, not hasattr)
+_IDENTITY_FIELD_SET = frozenset(_IDENTITY_FIELDS)
+_TECHNICAL_FIELD_SET = frozenset(_TECHNICAL_FIELDS)
+_STYLE_FIELD_SET = frozenset(f.name for f in fields(VoiceStyleProfile))
+
+
+@dataclass(slots=True)
 class VoiceUIModel:
     identity: VoiceIdentity = field(default_factory=VoiceIdentity)
     technical: VoiceTechnicalProfile = field(default_factory=VoiceTechnicalProfile)
@@ -96,7 +111,10 @@ class VoiceUIModel:
         self._listeners[event].append(callback)
 
     def _emit(self, event: str, payload: Any = None) -> None:
-        for cb in self._listeners.get(event, []):
+        listeners = self._listeners.get(event)
+        if not listeners:
+            return
+        for cb in listeners:
             cb(payload)
 
     def _touch(self) -> None:
@@ -107,34 +125,54 @@ class VoiceUIModel:
     def set_voice_identity(self, **kwargs) -> None:
         if self.locked_identity:
             return
+        identity = self.identity
         for key, value in kwargs.items():
-            if hasattr(self.identity, key):
-                setattr(self.identity, key, value)
+            if key in _IDENTITY_FIELD_SET:
+                setattr(identity, key, value)
         self._emit("identity_changed", self.identity)
         self._touch()
 
     def set_style(self, **kwargs) -> None:
         if self.locked_style:
             return
+        style = self.style
         for key, value in kwargs.items():
-            if hasattr(self.style, key):
-                setattr(self.style, key, value)
+            if key in _STYLE_FIELD_SET:
+                setattr(style, key, value)
+        self._emit("style_changed", self.style)
+        self._touch()
+
+    # Per-tick setters for sliders / automation: no kwargs dict, no
+    # attribute probing, one field write.
+
+    def set_intensity(self, value: float) -> None:
+        if self.locked_style:
+            return
+        self.style.intensity = value
+        self._emit("style_changed", self.style)
+        self._touch()
+
+    def set_emotion(self, emotion: VoiceEmotion) -> None:
+        if self.locked_style:
+            return
+        self.style.emotion = emotion
         self._emit("style_changed", self.style)
         self._touch()
 
     def set_technical(self, **kwargs) -> None:
         if self.locked_technical:
             return
+        technical = self.technical
         for key, value in kwargs.items():
-            if hasattr(self.technical, key):
-                setattr(self.technical, key, value)
+            if key in _TECHNICAL_FIELD_SET:
+                setattr(technical, key, value)
         self._emit("technical_changed", self.technical)
         self._touch()
 
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "identity": vars(self.identity),
-            "technical": vars(self.technical),
+            "identity": self._identity_dict(),
+            "technical": dict(zip(_TECHNICAL_FIELDS, _get_technical(self.technical))),
             "style": {
                 "emotion": self.style.emotion.value,
                 "intensity": self.style.intensity,
@@ -153,6 +191,15 @@ class VoiceUIModel:
             "last_modified": self.last_modified,
         }
 
+    def _identity_dict(self) -> Dict[str, Any]:
+        identity = self.identity
+        data = dict(zip(_IDENTITY_FIELDS, _get_identity(identity)))
+        # Enums serialize by value, matching what from_dict reads back
+        data["gender"] = identity.gender.value
+        data["register"] = identity.register.value
+        data["tags"] = list(identity.tags)
+        return data
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "VoiceUIModel":
         model = cls()
@@ -24,9 +24,10 @@ ALL actions via signals & bridge
 from __future__ import annotations
 
 import logging
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
 from PyQt6.QtWidgets import (
     QWidget,
     QHBoxLayout,
@@ -35,8 +36,7 @@ from PyQt6.QtWidgets import (
     QTextEdit,
     QSlider,
     QPushButton,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QFrame,
     QSizePolicy,
     QSplitter,
@@ -49,6 +49,8 @@ from desktop_gui.core.permissions import get_permissions
 
 logger = logging.getLogger("nosis.create_page")
 
+INSPECTOR_TEXT_CACHE_SIZE = 128
+
 
 # =============================================================================
 # CREATE PAGE
@@ -198,6 +200,53 @@ class GeneratorPanel(QFrame):
 # GENERATED LIBRARY PANEL
 # =============================================================================
 
+class GeneratedTracksModel(QAbstractListModel):
+    """
+    Generated track records for the library list.
+
+    Appends and in-place edits notify the view with row-level
+    insert / dataChanged signals; the list is never reset.
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self._records: List[Dict[str, Any]] = []
+        # Display text per row, built once on insert / update: the view
+        # asks for DisplayRole on every paint of every visible row.
+        self._labels: List[str] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._records)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._labels[index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            # Crosses QVariant as a QVariantMap: callers of index.data()
+            # receive a converted copy, never the stored dict itself.
+            return self._records[index.row()]
+        return None
+
+    @staticmethod
+    def _label(row: int, record: Dict[str, Any]) -> str:
+        return record.get("title") or f"Track #{row + 1}"
+
+    def append_track(self, record: Dict[str, Any]) -> None:
+        row = len(self._records)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._records.append(record)
+        self._labels.append(self._label(row, record))
+        self.endInsertRows()
+
+    def update_track(self, row: int, record: Dict[str, Any]) -> None:
+        self._records[row] = record
+        self._labels[row] = self._label(row, record)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+
 class GeneratedLibraryPanel(QFrame):
     """
     Middle panel: generated tracks.
@@ -212,6 +261,7 @@ class GeneratedLibraryPanel(QFrame):
         self.setMinimumWidth(320)
 
         self._init_ui()
+        self._signals.generation_finished.connect(self.add_track)
 
     def _init_ui(self):
         layout = QVBoxLayout(self)
@@ -221,18 +271,25 @@ class GeneratedLibraryPanel(QFrame):
         header.setObjectName("CreateLibraryHeader")
         layout.addWidget(header)
 
-        self.list = QListWidget()
-        self.list.itemClicked.connect(self._on_item_selected)
+        self.model = GeneratedTracksModel(self)
+
+        self.list = QListView()
+        self.list.setModel(self.model)
+        # All rows are single-line text: let the view skip per-row sizeHint
+        self.list.setUniformItemSizes(True)
+        self.list.clicked.connect(self._on_item_selected)
         layout.addWidget(self.list)
 
         # Example placeholder items (real ones come from backend)
         for i in range(4):
-            item = QListWidgetItem(f"Track #{i+1}")
-            item.setData(Qt.ItemDataRole.UserRole, {"id": i})
-            self.list.addItem(item)
+            self.model.append_track({"id": i, "title": f"Track #{i+1}"})
 
-    def _on_item_selected(self, item: QListWidgetItem):
-        data = item.data(Qt.ItemDataRole.UserRole)
+    def add_track(self, record: Dict[str, Any]) -> None:
+        """Append one generated result (row insert, no list rebuild)."""
+        self.model.append_track(record)
+
+    def _on_item_selected(self, index: QModelIndex):
+        data = index.data(Qt.ItemDataRole.UserRole)
         self._signals.generated_item_selected.emit(data)
 
 
@@ -252,6 +309,12 @@ class InspectorPanel(QFrame):
         self.setFrameShape(QFrame.Shape.NoFrame)
         self.setMinimumWidth(360)
 
+        # item id -> (record snapshot, rendered text). UserRole data comes
+        # back as a fresh dict per query, so hits compare by equality; that
+        # also rejects text for an updated record with the same id.
+        self._text_cache: "OrderedDict[Any, Tuple[Dict[str, Any], str]]" = OrderedDict()
+        self._shown_text: Optional[str] = None
+
         self._init_ui()
 
     def _init_ui(self):
@@ -269,10 +332,29 @@ class InspectorPanel(QFrame):
         layout.addStretch()
 
     def display_item(self, data: Optional[Dict[str, Any]]):
-        if not data:
-            self.content.setText("No selection")
+        text = self._render(data) if data else "No selection"
+        # Re-selecting the same item must not re-layout the text edit
+        if text == self._shown_text:
             return
-        self.content.setText(str(data))
+        self._shown_text = text
+        self.content.setText(text)
+
+    def _render(self, data: Dict[str, Any]) -> str:
+        key = data.get("id")
+        if key is None:
+            return str(data)
+
+        cache = self._text_cache
+        hit = cache.get(key)
+        if hit is not None and hit[0] == data:
+            cache.move_to_end(key)
+            return hit[1]
+
+        text = str(data)
+        cache[key] = (dict(data), text)
+        if len(cache) > INSPECTOR_TEXT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return text
 
 
 # =============================================================================
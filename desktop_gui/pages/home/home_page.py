@@ -161,8 +161,11 @@ class HomePage(QWidget):
     def _connect_signals(self) -> None:
         self._signals.user_logged_in.connect(self._refresh)
         self._signals.user_logged_out.connect(self._refresh)
-        self._signals.backend_connected.connect(self._refresh)
-        self._signals.backend_disconnected.connect(self._refresh)
+        # Emitted from bridge coroutines: queue so the refresh never
+        # runs inline inside a network call
+        queued = Qt.ConnectionType.QueuedConnection
+        self._signals.backend_connected.connect(self._refresh, queued)
+        self._signals.backend_disconnected.connect(self._refresh, queued)
         self._signals.credits_updated.connect(self._refresh)
 
     # ------------------------------------------------------------------
@@ -63,7 +63,7 @@ class BaseModal(QDialog):
     def _build_footer(self):
         self.footer = QFrame()
         self.footer.setObjectName("ModalFooter")
-        footer_layout = QHBoxLayout(self.footer)
+        self.footer_layout = footer_layout = QHBoxLayout(self.footer)
         footer_layout.setContentsMargins(0, 12, 0, 0)
         footer_layout.setSpacing(8)
         footer_layout.addStretch()
@@ -84,6 +84,12 @@ class BaseModal(QDialog):
         self.btn_cancel.setShortcut(Qt.Key.Key_Escape)
         self.btn_ok.setShortcut(Qt.Key.Key_Return)
 
+    def _clear_footer(self):
+        """Hide and unlayout the default buttons (kept as children, no reparent)."""
+        for btn in (self.btn_cancel, self.btn_ok):
+            btn.hide()
+            self.footer_layout.removeWidget(btn)
+
     def add_content(self, widget: QWidget):
         self.body_layout.addWidget(widget)
 
@@ -154,12 +160,10 @@ class CustomActionModal(BaseModal):
     def __init__(self, title: str, actions: dict[str, str]):
         super().__init__(title)
 
-        # Remove default buttons
-        for btn in self.footer.findChildren(QPushButton):
-            btn.setParent(None)
+        self._clear_footer()
 
-        footer_layout = self.footer.layout()
-        footer_layout.addStretch()
+        # The base footer's leading stretch still right-aligns the actions
+        footer_layout = self.footer_layout
 
         for action_id, label in actions.items():
             btn = QPushButton(label)